@@ -11,31 +11,39 @@ LOG_META_COLOR = "green"
 NOTE_META_COLOR = "yellow"
 
 
+# Rich colors chosen for good visibility in terminal displays
+_RANDOM_COLORS = (
+    "red",
+    "green",
+    "yellow",
+    "blue",
+    "magenta",
+    "cyan",
+    "bright_red",
+    "bright_green",
+    "bright_yellow",
+    "bright_blue",
+    "bright_magenta",
+    "bright_cyan",
+    "dark_orange",
+    "purple",
+    "deep_pink",
+    "spring_green",
+    "dark_violet",
+    "gold",
+    "orange",
+    "pink",
+)
+
+
 def get_random_color() -> str:
     """Return a random color from the Rich color palette.
 
     These colors are chosen for good visibility in terminal displays.
     """
-    colors = [
-        "red",
-        "green",
-        "yellow",
-        "blue",
-        "magenta",
-        "cyan",
-        "bright_red",
-        "bright_green",
-        "bright_yellow",
-        "bright_blue",
-        "bright_magenta",
-        "bright_cyan",
-        "dark_orange",
-        "purple",
-        "deep_pink",
-        "spring_green",
-        "dark_violet",
-        "gold",
-        "orange",
-        "pink",
-    ]
-    return random.choice(colors)
+    return random.choice(_RANDOM_COLORS)
+
+
+def get_random_colors(count: int) -> list[str]:
+    """Return count random colors from the same palette as get_random_color."""
+    return random.choices(_RANDOM_COLORS, k=count)
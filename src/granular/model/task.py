@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: MIT
 
-from typing import Optional, TypedDict
+from typing import Literal, Optional, TypedDict
 
 import pendulum
 
 from granular.model.entity_id import EntityId
 
+TaskStatusField = Literal["completed", "not_completed", "cancelled", "deleted"]
+
 
 class Task(TypedDict):
     id: Optional[EntityId]
@@ -20,6 +20,7 @@ from granular.model.entity_id import EntityId, generate_entity_id
 class ContextRepository:
     def __init__(self) -> None:
         self._contexts: Optional[list[Context]] = None
+        self._active_context: Optional[Context] = None
         self.is_dirty = False
         self._dirty_ids: set[str] = set()
         self._deleted_ids: set[str] = set()
@@ -92,10 +93,29 @@ class ContextRepository:
         return deepcopy(self.contexts)
 
     def get_active_context(self) -> Context:
-        return deepcopy([context for context in self.contexts if context["active"]][0])
+        return deepcopy(self.__active_context())
+
+    def require_active_context_name(self) -> str:
+        """Get the name of the active context, raising if it has none."""
+        name = self.__active_context()["name"]
+        if name is None:
+            raise ValueError("context name cannot be None")
+        return name
+
+    def __active_context(self) -> Context:
+        if self._active_context is None:
+            self._active_context = [
+                context for context in self.contexts if context["active"]
+            ][0]
+        return self._active_context
+
+    def invalidate(self) -> None:
+        """Forget the remembered active context; the next lookup scans again."""
+        self._active_context = None
 
     def save_new_context(self, context: Context) -> EntityId:
         self.is_dirty = True
+        self.invalidate()
 
         # Check for duplicate names
         for existing_context in self.contexts:
@@ -125,6 +145,7 @@ class ContextRepository:
     ) -> None:
         self.is_dirty = True
         self._dirty_ids.add(id)
+        self.invalidate()
 
         context = [context for context in self.contexts if context["id"] == id][0]
         # Set updated timestamp to current moment
@@ -172,6 +193,7 @@ class ContextRepository:
     def delete_context(self, id: EntityId) -> None:
         self.is_dirty = True
         self._deleted_ids.add(id)
+        self.invalidate()
         self._contexts = [context for context in self.contexts if context["id"] != id]
 
     def get_context(self, id: EntityId) -> Context:
@@ -131,29 +131,29 @@ class EventRepository:
     def modify_event(
         self,
         id: EntityId,
-        title: Optional[str],
-        description: Optional[str],
-        location: Optional[str],
-        projects: Optional[list[str]],
-        tags: Optional[list[str]],
-        color: Optional[str],
-        start: Optional[pendulum.DateTime],
-        end: Optional[pendulum.DateTime],
-        all_day: Optional[bool],
-        deleted: Optional[pendulum.DateTime],
-        ical_source: Optional[str],
-        ical_uid: Optional[str],
-        remove_title: bool,
-        remove_description: bool,
-        remove_location: bool,
-        remove_projects: bool,
-        remove_tags: bool,
-        remove_color: bool,
-        remove_end: bool,
-        remove_deleted: bool,
-        remove_ical_source: bool,
-        remove_ical_uid: bool,
-    ) -> None:
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        projects: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        color: Optional[str] = None,
+        start: Optional[pendulum.DateTime] = None,
+        end: Optional[pendulum.DateTime] = None,
+        all_day: Optional[bool] = None,
+        deleted: Optional[pendulum.DateTime] = None,
+        ical_source: Optional[str] = None,
+        ical_uid: Optional[str] = None,
+        remove_title: bool = False,
+        remove_description: bool = False,
+        remove_location: bool = False,
+        remove_projects: bool = False,
+        remove_tags: bool = False,
+        remove_color: bool = False,
+        remove_end: bool = False,
+        remove_deleted: bool = False,
+        remove_ical_source: bool = False,
+        remove_ical_uid: bool = False,
+    ) -> Event:
         self.is_dirty = True
         self._dirty_ids.add(id)
 
@@ -213,8 +213,13 @@ class EventRepository:
         if remove_ical_uid:
             event["ical_uid"] = None
 
-    def get_all_events(self) -> list[Event]:
-        return deepcopy(self.events)
+        return deepcopy(event)
+
+    def get_all_events(self, include_deleted: bool = True) -> list[Event]:
+        if include_deleted:
+            return deepcopy(self.events)
+        # Filter before copying so deleted events are never deep-copied
+        return deepcopy([event for event in self.events if event["deleted"] is None])
 
     def get_event(self, id: EntityId) -> Event:
         return deepcopy([event for event in self.events if event["id"] == id][0])
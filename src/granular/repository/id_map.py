@@ -15,7 +15,8 @@ from granular.model.id_map import EntityType, IdMap, IdMapDict
 from granular.template.id_map import get_id_map_template
 from granular.model.entity_id import EntityId
 
-ENTITY_TYPES = get_args(EntityType)
+# A frozenset keeps the per-lookup entity type check O(1)
+ENTITY_TYPES = frozenset(get_args(EntityType))
 
 
 class IdMapRepository:
@@ -78,6 +79,24 @@ class IdMapRepository:
             f"{IdMapRepository.associate_id.__name__}: expected {EntityType.__name__} literals"
         )
 
+    def get_real_ids(
+        self, entity_type: str, synthetic_ids: list[int]
+    ) -> dict[int, EntityId]:
+        """
+        Get the entity ids associated with several synthetic ids at once
+        """
+        if self.__narrow_to_entity_type(entity_type):
+            entity_type_lit = cast(EntityType, entity_type)
+            id_map_dict = cast(IdMapDict, self.id_map)
+            synthetic_to_real = id_map_dict[entity_type_lit]["synthetic_to_real"]
+            return {
+                synthetic_id: synthetic_to_real[synthetic_id]
+                for synthetic_id in synthetic_ids
+            }
+        raise TypeError(
+            f"{IdMapRepository.get_real_ids.__name__}: expected {EntityType.__name__} literals"
+        )
+
     def __narrow_to_entity_type(self, entity_type: str) -> TypeIs[EntityType]:
         global ENTITY_TYPES
 
@@ -100,7 +100,8 @@ class LogRepository:
         )
         return cast(Log, deserializable_log)
 
-    def save_new_log(self, log: Log) -> EntityId:
+    def save_new_log(self, log: Log) -> Log:
+        """Save a new log and return the stored log, including its new id."""
         self.is_dirty = True
 
         log["id"] = generate_entity_id()
@@ -118,7 +119,7 @@ class LogRepository:
         if log["projects"] is not None:
             PROJECT_REPO.add_projects(log["projects"])
 
-        return log["id"]
+        return deepcopy(log)
 
     def modify_log(
         self,
@@ -139,55 +140,108 @@ class LogRepository:
         remove_tags: bool,
         remove_color: bool,
         remove_deleted: bool,
-    ) -> None:
+    ) -> Log:
+        return self.modify_logs(
+            [id],
+            reference_id,
+            reference_type,
+            timestamp,
+            text,
+            projects,
+            tags,
+            color,
+            deleted,
+            remove_reference_id,
+            remove_reference_type,
+            remove_timestamp,
+            remove_text,
+            remove_projects,
+            remove_tags,
+            remove_color,
+            remove_deleted,
+        )[0]
+
+    def modify_logs(
+        self,
+        ids: list[EntityId],
+        reference_id: Optional[EntityId] = None,
+        reference_type: Optional[str] = None,
+        timestamp: Optional[pendulum.DateTime] = None,
+        text: Optional[str] = None,
+        projects: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        color: Optional[str] = None,
+        deleted: Optional[pendulum.DateTime] = None,
+        remove_reference_id: bool = False,
+        remove_reference_type: bool = False,
+        remove_timestamp: bool = False,
+        remove_text: bool = False,
+        remove_projects: bool = False,
+        remove_tags: bool = False,
+        remove_color: bool = False,
+        remove_deleted: bool = False,
+    ) -> list[Log]:
+        """
+        Apply the same changes to several logs in a single pass and return the
+        updated logs in the order of ids.
+        """
         self.is_dirty = True
-        self._dirty_ids.add(id)
-
-        log = [log for log in self.logs if log["id"] == id][0]
-        # Set updated timestamp to current moment
-        log["updated"] = time.now_utc()
-
-        if reference_id is not None:
-            log["reference_id"] = reference_id
-        if reference_type is not None:
-            log["reference_type"] = reference_type
-        if timestamp is not None:
-            log["timestamp"] = timestamp
-        if text is not None:
-            log["text"] = text
-        if projects is not None:
-            deduplicated_projects = list(dict.fromkeys(projects))
-            log["projects"] = deduplicated_projects
-            PROJECT_REPO.add_projects(deduplicated_projects)
-        if tags is not None:
-            # Deduplicate tags
-            deduplicated_tags = list(dict.fromkeys(tags))
-            log["tags"] = deduplicated_tags
-            TAG_REPO.add_tags(deduplicated_tags)
-        if color is not None:
-            log["color"] = color
-        if deleted is not None:
-            log["deleted"] = deleted
-
-        if remove_reference_id:
-            log["reference_id"] = None
-        if remove_reference_type:
-            log["reference_type"] = None
-        if remove_timestamp:
-            log["timestamp"] = None
-        if remove_text:
-            log["text"] = None
-        if remove_projects:
-            log["projects"] = None
-        if remove_tags:
-            log["tags"] = None
-        if remove_color:
-            log["color"] = None
-        if remove_deleted:
-            log["deleted"] = None
-
-    def get_all_logs(self) -> list[Log]:
-        return deepcopy(self.logs)
+        self._dirty_ids.update(ids)
+
+        wanted_ids = set(ids)
+        logs_by_id = {log["id"]: log for log in self.logs if log["id"] in wanted_ids}
+        logs = [logs_by_id[id] for id in ids]
+
+        for log in logs:
+            # Set updated timestamp to current moment
+            log["updated"] = time.now_utc()
+
+            if reference_id is not None:
+                log["reference_id"] = reference_id
+            if reference_type is not None:
+                log["reference_type"] = reference_type
+            if timestamp is not None:
+                log["timestamp"] = timestamp
+            if text is not None:
+                log["text"] = text
+            if projects is not None:
+                deduplicated_projects = list(dict.fromkeys(projects))
+                log["projects"] = deduplicated_projects
+                PROJECT_REPO.add_projects(deduplicated_projects)
+            if tags is not None:
+                # Deduplicate tags
+                deduplicated_tags = list(dict.fromkeys(tags))
+                log["tags"] = deduplicated_tags
+                TAG_REPO.add_tags(deduplicated_tags)
+            if color is not None:
+                log["color"] = color
+            if deleted is not None:
+                log["deleted"] = deleted
+
+            if remove_reference_id:
+                log["reference_id"] = None
+            if remove_reference_type:
+                log["reference_type"] = None
+            if remove_timestamp:
+                log["timestamp"] = None
+            if remove_text:
+                log["text"] = None
+            if remove_projects:
+                log["projects"] = None
+            if remove_tags:
+                log["tags"] = None
+            if remove_color:
+                log["color"] = None
+            if remove_deleted:
+                log["deleted"] = None
+
+        return deepcopy(logs)
+
+    def get_all_logs(self, include_deleted: bool = True) -> list[Log]:
+        if include_deleted:
+            return deepcopy(self.logs)
+        # Filter before copying so deleted logs are never deep-copied
+        return deepcopy([log for log in self.logs if log["deleted"] is None])
 
     def get_log(self, id: EntityId) -> Log:
         return deepcopy([log for log in self.logs if log["id"] == id][0])
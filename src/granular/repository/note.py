@@ -417,7 +417,7 @@ class NoteRepository:
         note: Note,
         external_filename: Optional[str] = None,
         note_folder_name: Optional[str] = None,
-    ) -> EntityId:
+    ) -> Note:
         """
         Save new note. Handles both embedded and external notes.
 
@@ -427,11 +427,12 @@ class NoteRepository:
             note_folder_name: Folder name (for external notes)
 
         Returns:
-            Note ID
+            The saved note, with its id and the text it was created with
         """
         self.is_dirty = True
 
         note["id"] = generate_entity_id()
+        text = note["text"]
 
         # Deduplicate tags
         if note["tags"] is not None:
@@ -439,7 +440,8 @@ class NoteRepository:
 
         # Handle external note file creation
         if external_filename and note_folder_name:
-            config = CONFIGURATION_REPO.get_config()
+            # The repository only reads the config, so it skips get_config's copy
+            config = CONFIGURATION_REPO.config
 
             # Get folder config
             note_folders = config.get("note_folders", [])
@@ -500,7 +502,10 @@ class NoteRepository:
         if note["projects"] is not None:
             PROJECT_REPO.add_projects(note["projects"])
 
-        return note["id"]
+        # External notes keep their text in the file; hand it back directly
+        saved_note = deepcopy(note)
+        saved_note["text"] = text
+        return saved_note
 
     def modify_note(
         self,
@@ -521,111 +526,172 @@ class NoteRepository:
         remove_projects: bool,
         remove_text: bool,
         remove_color: bool,
-    ) -> None:
+    ) -> Note:
+        return self.modify_notes(
+            [id],
+            reference_id,
+            reference_type,
+            timestamp,
+            deleted,
+            tags,
+            projects,
+            text,
+            color,
+            remove_reference_id,
+            remove_reference_type,
+            remove_timestamp,
+            remove_deleted,
+            remove_tags,
+            remove_projects,
+            remove_text,
+            remove_color,
+        )[0]
+
+    def modify_notes(
+        self,
+        ids: list[EntityId],
+        reference_id: Optional[EntityId] = None,
+        reference_type: Optional[str] = None,
+        timestamp: Optional[pendulum.DateTime] = None,
+        deleted: Optional[pendulum.DateTime] = None,
+        tags: Optional[list[str]] = None,
+        projects: Optional[list[str]] = None,
+        text: Optional[str] = None,
+        color: Optional[str] = None,
+        remove_reference_id: bool = False,
+        remove_reference_type: bool = False,
+        remove_timestamp: bool = False,
+        remove_deleted: bool = False,
+        remove_tags: bool = False,
+        remove_projects: bool = False,
+        remove_text: bool = False,
+        remove_color: bool = False,
+    ) -> list[Note]:
+        """
+        Apply the same changes to several notes in a single pass and return the
+        updated notes (with external content loaded) in the order of ids.
+        """
         self.is_dirty = True
-        self._dirty_ids.add(id)
-
-        note = [note for note in self.notes if note["id"] == id][0]
-
-        # Track if metadata changed (for frontmatter sync)
-        metadata_changed = False
-
-        # Apply modifications
-        if reference_id is not None:
-            note["reference_id"] = reference_id
-            metadata_changed = True
-        if reference_type is not None:
-            note["reference_type"] = reference_type
-            metadata_changed = True
-        if timestamp is not None:
-            note["timestamp"] = timestamp
-            metadata_changed = True
-        if deleted is not None:
-            note["deleted"] = deleted
-            metadata_changed = True
-        if tags is not None:
-            # Deduplicate tags
-            deduplicated_tags = list(dict.fromkeys(tags))
-            note["tags"] = deduplicated_tags
-            TAG_REPO.add_tags(deduplicated_tags)
-            metadata_changed = True
-        if projects is not None:
-            deduplicated_projects = list(dict.fromkeys(projects))
-            note["projects"] = deduplicated_projects
-            PROJECT_REPO.add_projects(deduplicated_projects)
-            metadata_changed = True
-        if color is not None:
-            note["color"] = color
-            metadata_changed = True
-
-        # Handle text update
-        if text is not None:
-            if note.get("external_file_path"):
-                # Update external file content
-                config = CONFIGURATION_REPO.get_config()
-                absolute_path = self._resolve_external_file_path(note, config)
+        self._dirty_ids.update(ids)
 
-                metadata = None
-                if note.get("sync_frontmatter"):
-                    metadata = self.__convert_note_metadata_for_serialization(note)
-
-                self.__write_external_note_file(absolute_path, text, metadata)
+        wanted_ids = set(ids)
+        notes_by_id = {
+            note["id"]: note for note in self.notes if note["id"] in wanted_ids
+        }
+        notes = [notes_by_id[id] for id in ids]
 
-                # Don't store text in notes.yaml
+        for note in notes:
+            # Track if metadata changed (for frontmatter sync)
+            metadata_changed = False
+
+            # Apply modifications
+            if reference_id is not None:
+                note["reference_id"] = reference_id
+                metadata_changed = True
+            if reference_type is not None:
+                note["reference_type"] = reference_type
+                metadata_changed = True
+            if timestamp is not None:
+                note["timestamp"] = timestamp
+                metadata_changed = True
+            if deleted is not None:
+                note["deleted"] = deleted
+                metadata_changed = True
+            if tags is not None:
+                # Deduplicate tags
+                deduplicated_tags = list(dict.fromkeys(tags))
+                note["tags"] = deduplicated_tags
+                TAG_REPO.add_tags(deduplicated_tags)
+                metadata_changed = True
+            if projects is not None:
+                deduplicated_projects = list(dict.fromkeys(projects))
+                note["projects"] = deduplicated_projects
+                PROJECT_REPO.add_projects(deduplicated_projects)
+                metadata_changed = True
+            if color is not None:
+                note["color"] = color
+                metadata_changed = True
+
+            # Handle text update
+            if text is not None:
+                if note.get("external_file_path"):
+                    # Update external file content
+                    config = CONFIGURATION_REPO.config
+                    absolute_path = self._resolve_external_file_path(note, config)
+
+                    metadata = None
+                    if note.get("sync_frontmatter"):
+                        metadata = self.__convert_note_metadata_for_serialization(note)
+
+                    self.__write_external_note_file(absolute_path, text, metadata)
+
+                    # Don't store text in notes.yaml
+                    note["text"] = None
+                else:
+                    # Embedded note
+                    note["text"] = text
+
+            # Handle removals
+            if remove_reference_id:
+                note["reference_id"] = None
+                metadata_changed = True
+            if remove_reference_type:
+                note["reference_type"] = None
+                metadata_changed = True
+            if remove_timestamp:
+                note["timestamp"] = None
+                metadata_changed = True
+            if remove_deleted:
+                note["deleted"] = None
+                metadata_changed = True
+            if remove_tags:
+                note["tags"] = None
+                metadata_changed = True
+            if remove_projects:
+                note["projects"] = None
+                metadata_changed = True
+            if remove_text:
+                if note.get("external_file_path"):
+                    # Update external file with empty content
+                    config = CONFIGURATION_REPO.config
+                    absolute_path = self._resolve_external_file_path(note, config)
+
+                    metadata = None
+                    if note.get("sync_frontmatter"):
+                        metadata = self.__convert_note_metadata_for_serialization(note)
+
+                    self.__write_external_note_file(absolute_path, "", metadata)
                 note["text"] = None
-            else:
-                # Embedded note
-                note["text"] = text
+            if remove_color:
+                note["color"] = None
+                metadata_changed = True
 
-        # Handle removals
-        if remove_reference_id:
-            note["reference_id"] = None
-            metadata_changed = True
-        if remove_reference_type:
-            note["reference_type"] = None
-            metadata_changed = True
-        if remove_timestamp:
-            note["timestamp"] = None
-            metadata_changed = True
-        if remove_deleted:
-            note["deleted"] = None
-            metadata_changed = True
-        if remove_tags:
-            note["tags"] = None
-            metadata_changed = True
-        if remove_projects:
-            note["projects"] = None
+            # Always update 'updated' timestamp
+            note["updated"] = now_utc()
             metadata_changed = True
-        if remove_text:
-            if note.get("external_file_path"):
-                # Update external file with empty content
-                config = CONFIGURATION_REPO.get_config()
-                absolute_path = self._resolve_external_file_path(note, config)
-
-                metadata = None
-                if note.get("sync_frontmatter"):
-                    metadata = self.__convert_note_metadata_for_serialization(note)
 
-                self.__write_external_note_file(absolute_path, "", metadata)
-            note["text"] = None
-        if remove_color:
-            note["color"] = None
-            metadata_changed = True
+            # Sync frontmatter if metadata changed and note is external
+            if metadata_changed and note.get("external_file_path"):
+                config = CONFIGURATION_REPO.config
+                self.__sync_external_note_frontmatter(note, config)
 
-        # Always update 'updated' timestamp
-        note["updated"] = now_utc()
-        metadata_changed = True
+        modified_notes = deepcopy(notes)
+        config = CONFIGURATION_REPO.config
+        for note in modified_notes:
+            if note.get("external_file_path"):
+                note["text"] = self.__read_external_note_content(note, config)
 
-        # Sync frontmatter if metadata changed and note is external
-        if metadata_changed and note.get("external_file_path"):
-            config = CONFIGURATION_REPO.get_config()
-            self.__sync_external_note_frontmatter(note, config)
+        return modified_notes
 
-    def get_all_notes(self) -> list[Note]:
+    def get_all_notes(self, include_deleted: bool = True) -> list[Note]:
         """Get all notes. Loads content from external files where applicable."""
 
-        notes = deepcopy(self.notes)
-        config = CONFIGURATION_REPO.get_config()
+        if include_deleted:
+            notes = deepcopy(self.notes)
+        else:
+            # Filter before copying so deleted notes are never copied or read
+            notes = deepcopy([note for note in self.notes if note["deleted"] is None])
+        config = CONFIGURATION_REPO.config
 
         for note in notes:
             if note.get("external_file_path"):
@@ -640,7 +706,7 @@ class NoteRepository:
 
         # Load content from external file if needed
         if note.get("external_file_path"):
-            config = CONFIGURATION_REPO.get_config()
+            config = CONFIGURATION_REPO.config
             note["text"] = self.__read_external_note_content(note, config)
 
         return note
@@ -13,7 +13,7 @@ except ImportError:
     from yaml import Dumper, Loader  # type: ignore[assignment]
 
 from granular import configuration, time
-from granular.model.task import Task
+from granular.model.task import Task, TaskStatusField
 from granular.repository.project import PROJECT_REPO
 from granular.repository.tag import TAG_REPO
 from granular.model.entity_id import EntityId, generate_entity_id
@@ -22,6 +22,7 @@ from granular.model.entity_id import EntityId, generate_entity_id
 class TaskRepository:
     def __init__(self) -> None:
         self._tasks: Optional[list[Task]] = None
+        self._tasks_by_id: dict[EntityId, Task] = {}
         self.is_dirty = False
         self._dirty_ids: set[str] = set()
         self._deleted_ids: set[str] = set()
@@ -42,6 +43,8 @@ class TaskRepository:
             raw_task = load(file_path.read_text(), Loader=Loader)
             if raw_task is not None:
                 self._tasks.append(self.__convert_task_for_deserialization(raw_task))
+        # Index the same dicts by id so single-task lookups avoid a scan
+        self._tasks_by_id = {cast(EntityId, task["id"]): task for task in self._tasks}
 
     def __save_data(self) -> None:
         # Write dirty entities
@@ -148,6 +151,7 @@ class TaskRepository:
             task["tags"] = list(dict.fromkeys(task["tags"]))
 
         self.tasks.append(task)
+        self._tasks_by_id[task["id"]] = task
         self._dirty_ids.add(task["id"])
 
         # Update tag and project caches
@@ -161,41 +165,80 @@ class TaskRepository:
     def modify_task(
         self,
         id: EntityId,
-        cloned_from_id: Optional[EntityId],
-        timespan_id: Optional[EntityId],
-        description: Optional[str],
-        projects: Optional[list[str]],
-        tags: Optional[list[str]],
-        priority: Optional[int],
-        color: Optional[str],
-        estimate: Optional[pendulum.Duration],
-        scheduled: Optional[pendulum.DateTime],
-        due: Optional[pendulum.DateTime],
-        started: Optional[pendulum.DateTime],
-        completed: Optional[pendulum.DateTime],
-        not_completed: Optional[pendulum.DateTime],
-        cancelled: Optional[pendulum.DateTime],
-        deleted: Optional[pendulum.DateTime],
-        remove_cloned_from_id: bool,
-        remove_timespan_id: bool,
-        remove_description: bool,
-        remove_projects: bool,
-        remove_tags: bool,
-        remove_priority: bool,
-        remove_color: bool,
-        remove_estimate: bool,
-        remove_scheduled: bool,
-        remove_due: bool,
-        remove_started: bool,
-        remove_completed: bool,
-        remove_not_completed: bool,
-        remove_cancelled: bool,
-        remove_deleted: bool,
-    ) -> None:
+        cloned_from_id: Optional[EntityId] = None,
+        timespan_id: Optional[EntityId] = None,
+        description: Optional[str] = None,
+        projects: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        priority: Optional[int] = None,
+        color: Optional[str] = None,
+        estimate: Optional[pendulum.Duration] = None,
+        scheduled: Optional[pendulum.DateTime] = None,
+        due: Optional[pendulum.DateTime] = None,
+        started: Optional[pendulum.DateTime] = None,
+        completed: Optional[pendulum.DateTime] = None,
+        not_completed: Optional[pendulum.DateTime] = None,
+        cancelled: Optional[pendulum.DateTime] = None,
+        deleted: Optional[pendulum.DateTime] = None,
+        remove_cloned_from_id: bool = False,
+        remove_timespan_id: bool = False,
+        remove_description: bool = False,
+        remove_projects: bool = False,
+        remove_tags: bool = False,
+        remove_priority: bool = False,
+        remove_color: bool = False,
+        remove_estimate: bool = False,
+        remove_scheduled: bool = False,
+        remove_due: bool = False,
+        remove_started: bool = False,
+        remove_completed: bool = False,
+        remove_not_completed: bool = False,
+        remove_cancelled: bool = False,
+        remove_deleted: bool = False,
+    ) -> Task:
+        """Apply the requested changes to a task and return the updated task."""
+        # Leave the task (and its file) untouched when nothing is requested
+        values = (
+            cloned_from_id,
+            timespan_id,
+            description,
+            projects,
+            tags,
+            priority,
+            color,
+            estimate,
+            scheduled,
+            due,
+            started,
+            completed,
+            not_completed,
+            cancelled,
+            deleted,
+        )
+        removals = (
+            remove_cloned_from_id,
+            remove_timespan_id,
+            remove_description,
+            remove_projects,
+            remove_tags,
+            remove_priority,
+            remove_color,
+            remove_estimate,
+            remove_scheduled,
+            remove_due,
+            remove_started,
+            remove_completed,
+            remove_not_completed,
+            remove_cancelled,
+            remove_deleted,
+        )
+        task = self.__task(id)
+        if all(value is None for value in values) and not any(removals):
+            return deepcopy(task)
+
         self.is_dirty = True
         self._dirty_ids.add(id)
 
-        task = [task for task in self.tasks if task["id"] == id][0]
         # Set updated timestamp to current moment
         task["updated"] = time.now_utc()
         if cloned_from_id is not None:
@@ -265,11 +308,62 @@ class TaskRepository:
         if remove_deleted:
             task["deleted"] = None
 
-    def get_all_tasks(self) -> list[Task]:
-        return deepcopy(self.tasks)
+        return deepcopy(task)
+
+    def set_status(
+        self, id: EntityId, status_field: TaskStatusField, timestamp: pendulum.DateTime
+    ) -> Task:
+        """
+        Stamp a single status field without going through modify_task and
+        return the updated task.
+        """
+        self.is_dirty = True
+        self._dirty_ids.add(id)
+
+        task = self.__task(id)
+        # Set updated timestamp to current moment
+        task["updated"] = time.now_utc()
+        task[status_field] = timestamp
+        return deepcopy(task)
+
+    def get_task_ids_missing_color(self) -> list[EntityId]:
+        """Get the ids of tasks without a color, without copying any task."""
+        return [
+            cast(EntityId, task["id"]) for task in self.tasks if task["color"] is None
+        ]
+
+    def bulk_set_colors(self, colors: dict[EntityId, str]) -> None:
+        """Set the color of several tasks in one pass."""
+        if not colors:
+            return
+        self.is_dirty = True
+        self._dirty_ids.update(colors)
+
+        updated = time.now_utc()
+        for id, color in colors.items():
+            task = self.__task(id)
+            task["updated"] = updated
+            task["color"] = color
+
+    def get_all_tasks(self, include_deleted: bool = True) -> list[Task]:
+        if include_deleted:
+            return deepcopy(self.tasks)
+        # Filter before copying so deleted tasks are never deep-copied
+        return deepcopy([task for task in self.tasks if task["deleted"] is None])
 
     def get_task(self, id: EntityId) -> Task:
-        return deepcopy([task for task in self.tasks if task["id"] == id][0])
+        return deepcopy(self.__task(id))
+
+    def get_tasks(self, ids: list[EntityId]) -> list[Task]:
+        """
+        Get several tasks at once, in the order of ids
+        """
+        return [deepcopy(self.__task(id)) for id in ids]
+
+    def __task(self, id: EntityId) -> Task:
+        if self._tasks is None:
+            self.__load_data()
+        return self._tasks_by_id[id]
 
 
 TASK_REPO = TaskRepository()
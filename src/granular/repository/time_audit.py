@@ -139,24 +139,24 @@ class TimeAuditRepository:
     def modify_time_audit(
         self,
         id: EntityId,
-        description: Optional[str],
-        projects: Optional[list[str]],
-        tags: Optional[list[str]],
-        color: Optional[str],
-        start: Optional[pendulum.DateTime],
-        end: Optional[pendulum.DateTime],
-        deleted: Optional[pendulum.DateTime],
-        remove_description: bool,
-        remove_projects: bool,
-        remove_tags: bool,
-        remove_color: bool,
-        remove_start: bool,
-        remove_end: bool,
-        remove_deleted: bool,
+        description: Optional[str] = None,
+        projects: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+        color: Optional[str] = None,
+        start: Optional[pendulum.DateTime] = None,
+        end: Optional[pendulum.DateTime] = None,
+        deleted: Optional[pendulum.DateTime] = None,
+        remove_description: bool = False,
+        remove_projects: bool = False,
+        remove_tags: bool = False,
+        remove_color: bool = False,
+        remove_start: bool = False,
+        remove_end: bool = False,
+        remove_deleted: bool = False,
         add_task_ids: Optional[list[EntityId]] = None,
         remove_task_ids: Optional[list[EntityId]] = None,
         remove_all_task_ids: bool = False,
-    ) -> None:
+    ) -> TimeAudit:
         self.is_dirty = True
         self._dirty_ids.add(id)
 
@@ -221,8 +221,50 @@ class TimeAuditRepository:
         if remove_all_task_ids:
             time_audit["task_ids"] = None
 
-    def get_all_time_audits(self) -> list[TimeAudit]:
-        return deepcopy(self.time_audits)
+        return deepcopy(time_audit)
+
+    def close_open_time_audits(self, end: pendulum.DateTime) -> None:
+        """Set the end of every open, non-deleted time audit in one pass."""
+        updated = time.now_utc()
+        for time_audit in self.time_audits:
+            if time_audit["end"] is None and time_audit["deleted"] is None:
+                self.is_dirty = True
+                self._dirty_ids.add(time_audit["id"])  # type: ignore[arg-type]
+                time_audit["updated"] = updated
+                time_audit["end"] = end
+
+    def get_time_audit_ids_missing_color(self) -> list[EntityId]:
+        """Get the ids of time audits without a color, without copying any audit."""
+        return [
+            cast(EntityId, time_audit["id"])
+            for time_audit in self.time_audits
+            if time_audit["color"] is None
+        ]
+
+    def bulk_set_colors(self, colors: dict[EntityId, str]) -> None:
+        """Set the color of several time audits in one pass."""
+        if not colors:
+            return
+        self.is_dirty = True
+        self._dirty_ids.update(colors)
+
+        updated = time.now_utc()
+        for time_audit in self.time_audits:
+            if time_audit["id"] in colors:
+                time_audit["updated"] = updated
+                time_audit["color"] = colors[time_audit["id"]]
+
+    def get_all_time_audits(self, include_deleted: bool = True) -> list[TimeAudit]:
+        if include_deleted:
+            return deepcopy(self.time_audits)
+        # Filter before copying so deleted time audits are never deep-copied
+        return deepcopy(
+            [
+                time_audit
+                for time_audit in self.time_audits
+                if time_audit["deleted"] is None
+            ]
+        )
 
     def get_active_time_audits(self) -> list[TimeAudit]:
         return [
@@ -231,11 +273,47 @@ class TimeAuditRepository:
             if time_audit["deleted"] is None
         ]
 
+    def get_open_time_audits(self) -> list[TimeAudit]:
+        """
+        Get the non-deleted time audits that have no end yet
+        """
+        return deepcopy(
+            [
+                time_audit
+                for time_audit in self.time_audits
+                if time_audit["end"] is None and time_audit["deleted"] is None
+            ]
+        )
+
+    def get_time_audits_for_tasks(self, task_ids: list[EntityId]) -> list[TimeAudit]:
+        """
+        Get the non-deleted time audits linked to any of the given tasks
+        """
+        task_id_set = frozenset(task_ids)
+        return deepcopy(
+            [
+                time_audit
+                for time_audit in self.time_audits
+                if time_audit["deleted"] is None
+                and time_audit["task_ids"] is not None
+                and not task_id_set.isdisjoint(time_audit["task_ids"])
+            ]
+        )
+
     def get_time_audit(self, id: EntityId) -> TimeAudit:
         return deepcopy(
             [time_audit for time_audit in self.time_audits if time_audit["id"] == id][0]
         )
 
+    def get_time_audits(self, ids: list[EntityId]) -> list[TimeAudit]:
+        """
+        Get several time audits at once, in the order of ids
+        """
+        time_audits_by_id = {
+            time_audit["id"]: time_audit for time_audit in self.time_audits
+        }
+        return [deepcopy(time_audits_by_id[id]) for id in ids]
+
     def get_adjacent_time_audit_before(self, id: EntityId) -> Optional[TimeAudit]:
         """
         Get the time audit that comes immediately before the specified time audit,
@@ -318,47 +396,18 @@ class TimeAuditRepository:
         previous_audit = self.get_adjacent_time_audit_before(id)
 
         # Modify the target audit's start time
-        self.modify_time_audit(
+        modified_target = self.modify_time_audit(
             id,
-            None,
-            None,
-            None,
-            None,
-            new_start,
-            None,
-            None,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
+            start=new_start,
         )
 
         # If there's a previous audit, update its end time
         modified_previous = None
         if previous_audit is not None and previous_audit["id"] is not None:
-            self.modify_time_audit(
+            modified_previous = self.modify_time_audit(
                 previous_audit["id"],
-                None,
-                None,
-                None,
-                None,
-                None,
-                new_start,
-                None,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
+                end=new_start,
             )
-            modified_previous = self.get_time_audit(previous_audit["id"])
-
-        modified_target = self.get_time_audit(id)
 
         return (modified_target, modified_previous)
 
@@ -378,47 +427,18 @@ class TimeAuditRepository:
         next_audit = self.get_adjacent_time_audit_after(id)
 
         # Modify the target audit's end time
-        self.modify_time_audit(
+        modified_target = self.modify_time_audit(
             id,
-            None,
-            None,
-            None,
-            None,
-            None,
-            new_end,
-            None,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
+            end=new_end,
         )
 
         # If there's a next audit, update its start time
         modified_next = None
         if next_audit is not None and next_audit["id"] is not None:
-            self.modify_time_audit(
+            modified_next = self.modify_time_audit(
                 next_audit["id"],
-                None,
-                None,
-                None,
-                None,
-                new_end,
-                None,
-                None,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
+                start=new_end,
             )
-            modified_next = self.get_time_audit(next_audit["id"])
-
-        modified_target = self.get_time_audit(id)
 
         return (modified_target, modified_next)
 
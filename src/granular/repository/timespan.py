@@ -229,8 +229,13 @@ class TimespanRepository:
         if remove_deleted:
             timespan["deleted"] = None
 
-    def get_all_timespans(self) -> list[Timespan]:
-        return deepcopy(self.timespans)
+    def get_all_timespans(self, include_deleted: bool = True) -> list[Timespan]:
+        if include_deleted:
+            return deepcopy(self.timespans)
+        # Filter before copying so deleted timespans are never deep-copied
+        return deepcopy(
+            [timespan for timespan in self.timespans if timespan["deleted"] is None]
+        )
 
     def get_timespan(self, id: EntityId) -> Timespan:
         return deepcopy(
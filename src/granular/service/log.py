@@ -5,6 +5,8 @@ from typing import Optional
 import pendulum
 
 from granular.color import get_random_color
+from granular.configuration import Configuration
+from granular.model.context import Context
 from granular.model.entity_id import EntityId
 from granular.model.log import Log
 from granular.repository.configuration import CONFIGURATION_REPO
@@ -22,6 +24,8 @@ def create_log_for_entity(
     timestamp: Optional[pendulum.DateTime] = None,
     add_tags: Optional[list[str]] = None,
     color: Optional[str] = None,
+    config: Optional[Configuration] = None,
+    active_context: Optional[Context] = None,
 ) -> Log:
     """
     Create a log entry for an entity (task, time_audit, or event).
@@ -38,12 +42,16 @@ def create_log_for_entity(
         timestamp: Optional timestamp (defaults to now)
         add_tags: Additional tags to add
         color: Explicit color (if None, may use random color)
+        config: Already loaded configuration (loaded here if None)
+        active_context: Already loaded active context (loaded here if None)
 
     Returns:
         Log entry ready to be saved
     """
-    active_context = CONTEXT_REPO.get_active_context()
-    config = CONFIGURATION_REPO.get_config()
+    if active_context is None:
+        active_context = CONTEXT_REPO.get_active_context()
+    if config is None:
+        config = CONFIGURATION_REPO.get_config()
 
     # Start with entity tags
     log_tags = entity_tags if entity_tags is not None else []
@@ -21,7 +21,7 @@ class SearchResult(TypedDict):
     tags: Optional[list[str]]
 
 
-def __fuzzy_match(query: str, text: Optional[str]) -> bool:
+def __fuzzy_match(query_lower: str, text: Optional[str]) -> bool:
     """
     Perform case-insensitive fuzzy matching.
 
@@ -29,7 +29,7 @@ def __fuzzy_match(query: str, text: Optional[str]) -> bool:
     in the same order (but not necessarily consecutively).
 
     Args:
-        query: The search query string
+        query_lower: The search query string, already lowercased
         text: The text to search within
 
     Returns:
@@ -38,7 +38,6 @@ def __fuzzy_match(query: str, text: Optional[str]) -> bool:
     if text is None:
         return False
 
-    query_lower = query.lower()
     text_lower = text.lower()
 
     # Simple substring match (case-insensitive)
@@ -82,7 +81,7 @@ def __convert_to_search_result(
 def __search_in_entity(
     entity: Union[Task, TimeAudit, Event, Timespan, Note, Log],
     entity_type: str,
-    query: str,
+    query_lower: str,
     search_in_description: bool,
     search_in_tags: bool,
     search_in_project: bool,
@@ -93,7 +92,7 @@ def __search_in_entity(
     Args:
         entity: The entity to search
         entity_type: The type of the entity
-        query: The search query string
+        query_lower: The search query string, already lowercased
         search_in_description: Whether to search in description/title/text fields
         search_in_tags: Whether to search in tags
         search_in_project: Whether to search in project field
@@ -114,7 +113,7 @@ def __search_in_entity(
         else:
             description_field = cast(Optional[str], entity.get("description"))
 
-        if __fuzzy_match(query, description_field):
+        if __fuzzy_match(query_lower, description_field):
             matched = True
 
     # Search in tags
@@ -122,7 +121,7 @@ def __search_in_entity(
         tags = entity.get("tags")
         if tags is not None:
             for tag in tags:
-                if __fuzzy_match(query, tag):
+                if __fuzzy_match(query_lower, tag):
                     matched = True
                     break
 
@@ -131,7 +130,7 @@ def __search_in_entity(
         projects = entity.get("projects")
         if projects is not None:
             for project in projects:
-                if __fuzzy_match(query, project):
+                if __fuzzy_match(query_lower, project):
                     matched = True
                     break
 
@@ -170,12 +169,15 @@ def search_entities(
     """
     results: list[SearchResult] = []
 
+    # Lowercase the query once rather than for every field of every entity
+    query_lower = query.lower()
+
     # Search tasks
     for task in tasks:
         if __search_in_entity(
             task,
             "task",
-            query,
+            query_lower,
             search_in_description,
             search_in_tags,
             search_in_project,
@@ -187,7 +189,7 @@ def search_entities(
         if __search_in_entity(
             time_audit,
             "time_audit",
-            query,
+            query_lower,
             search_in_description,
             search_in_tags,
             search_in_project,
@@ -199,7 +201,7 @@ def search_entities(
         if __search_in_entity(
             event,
             "event",
-            query,
+            query_lower,
             search_in_description,
             search_in_tags,
             search_in_project,
@@ -211,7 +213,7 @@ def search_entities(
         if __search_in_entity(
             timespan,
             "timespan",
-            query,
+            query_lower,
             search_in_description,
             search_in_tags,
             search_in_project,
@@ -223,7 +225,7 @@ def search_entities(
         if __search_in_entity(
             note,
             "note",
-            query,
+            query_lower,
             search_in_description,
             search_in_tags,
             search_in_project,
@@ -233,7 +235,12 @@ def search_entities(
     # Search logs
     for log in logs:
         if __search_in_entity(
-            log, "log", query, search_in_description, search_in_tags, search_in_project
+            log,
+            "log",
+            query_lower,
+            search_in_description,
+            search_in_tags,
+            search_in_project,
         ):
             results.append(__convert_to_search_result(log, "log"))
 
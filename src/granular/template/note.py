@@ -5,13 +5,14 @@ from granular.time import now_utc
 
 
 def get_note_template() -> Note:
+    now = now_utc()
     return {
         "id": None,
         "reference_id": None,
         "reference_type": None,
         "timestamp": None,
-        "created": now_utc(),
-        "updated": now_utc(),
+        "created": now,
+        "updated": now,
         "deleted": None,
         "tags": None,
         "projects": None,
@@ -19,6 +19,7 @@ from granular.terminal import (
     view,
 )
 from granular.terminal.custom_typer import ContextAwareTyperGroup
+from granular.terminal.parse import reset_relative_dates
 from granular.terminal.search import search
 from granular.terminal.version import version
 from granular.view import state as view_state
@@ -67,6 +68,9 @@ def main_callback(
 
     Global options that apply to all commands.
     """
+    # Relative dates like "today" or "1" are resolved against this command's start
+    reset_relative_dates()
+
     if no_header:
         view_state.set_show_header(False)
     if clear_ids:
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: MIT
 
+from itertools import chain
 from typing import Annotated, Optional, cast
 
 import icalevents.icalevents
+import icalevents.icalparser
 import pendulum
 import typer
+from rich.console import Console
 
 from granular.color import get_random_color
 from granular.model.entity_id import EntityId
@@ -27,7 +30,11 @@ from granular.terminal.parse import (
     parse_datetime,
     parse_id_list,
 )
-from granular.time import now_utc, python_to_pendulum_utc_optional
+from granular.time import (
+    now_utc,
+    python_to_pendulum_utc_optional,
+    start_of_today_utc,
+)
 from granular.version.version import Version
 from granular.view.terminal_dispatch import show_cached_dispatch
 from granular.view.view.views import event as event_report
@@ -36,6 +43,8 @@ from granular.view.view.views import note as note_report
 
 app = typer.Typer(cls=ContextAwareTyperGroup, no_args_is_help=True)
 
+console = Console()
+
 
 @app.command("add, a", no_args_is_help=True)
 def add(
@@ -122,7 +131,7 @@ def add(
     else:
         # For all-day events without explicit start, use midnight of current day in local timezone
         if all_day:
-            event["start"] = pendulum.now("local").start_of("day").in_tz("UTC")
+            event["start"] = start_of_today_utc()
         else:
             event["start"] = now_utc()
     event["end"] = end.in_tz("UTC") if end is not None else None
@@ -240,24 +249,35 @@ def modify(
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
+    # Removals are checked once per tag/project of every event, so use sets
+    remove_tag_set = frozenset(remove_tag_list) if remove_tag_list is not None else None
+    remove_project_set = (
+        frozenset(remove_project_list) if remove_project_list is not None else None
+    )
+
     # Process each event
     modified_events = []
     for event_id in ids:
         real_id: EntityId = ID_MAP_REPO.get_real_id("events", event_id)
 
+        # Read the current event once for both the tag and project merges
+        edits_tags = add_tags is not None or remove_tag_list is not None
+        edits_projects = add_projects is not None or remove_project_list is not None
+        if edits_tags or edits_projects:
+            event = EVENT_REPO.get_event(real_id)
+
         # Handle tag modifications
         updated_tags = None
-        if add_tags is not None or remove_tag_list is not None:
-            event = EVENT_REPO.get_event(real_id)
-            current_tags = event["tags"] if event["tags"] is not None else []
-            updated_tags = list(current_tags)
+        if edits_tags:
+            # get_event returns a copy, so its list can be extended in place
+            updated_tags = event["tags"] if event["tags"] is not None else []
 
             if add_tags is not None:
                 updated_tags.extend(add_tags)
 
-            if remove_tag_list is not None:
+            if remove_tag_set is not None:
                 updated_tags = [
-                    tag for tag in updated_tags if tag not in remove_tag_list
+                    tag for tag in updated_tags if tag not in remove_tag_set
                 ]
 
             # Set to None if empty, otherwise keep the list
@@ -265,59 +285,54 @@ def modify(
 
         # Handle project modifications
         updated_projects = None
-        if add_projects is not None or remove_project_list is not None:
-            event = EVENT_REPO.get_event(real_id)
-            current_projects = (
+        if edits_projects:
+            updated_projects = (
                 event["projects"] if event["projects"] is not None else []
             )
-            updated_projects = list(current_projects)
 
             if add_projects is not None:
                 updated_projects.extend(add_projects)
 
-            if remove_project_list is not None:
+            if remove_project_set is not None:
                 updated_projects = [
-                    p for p in updated_projects if p not in remove_project_list
+                    p for p in updated_projects if p not in remove_project_set
                 ]
 
             # Set to None if empty, otherwise keep the list
             updated_projects = updated_projects if len(updated_projects) > 0 else None
 
-        EVENT_REPO.modify_event(
+        event = EVENT_REPO.modify_event(
             real_id,
-            title,
-            description,
-            location,
-            updated_projects,
-            updated_tags,
-            color,
-            start,
-            end,
-            all_day,
-            deleted,
-            ical_source,
-            ical_uid,
-            remove_title,
-            remove_description,
-            remove_location,
-            remove_projects,
-            remove_tags,
-            remove_color,
-            remove_end,
-            remove_deleted,
-            remove_ical_source,
-            remove_ical_uid,
+            title=title,
+            description=description,
+            location=location,
+            projects=updated_projects,
+            tags=updated_tags,
+            color=color,
+            start=start,
+            end=end,
+            all_day=all_day,
+            deleted=deleted,
+            ical_source=ical_source,
+            ical_uid=ical_uid,
+            remove_title=remove_title,
+            remove_description=remove_description,
+            remove_location=remove_location,
+            remove_projects=remove_projects,
+            remove_tags=remove_tags,
+            remove_color=remove_color,
+            remove_end=remove_end,
+            remove_deleted=remove_deleted,
+            remove_ical_source=remove_ical_source,
+            remove_ical_uid=remove_ical_uid,
         )
-
-        event = EVENT_REPO.get_event(real_id)
         modified_events.append(event)
 
     if config["use_git_versioning"]:
         event_titles = [f"{e['id']}: {e['title']}" for e in modified_events]
         version.create_data_checkpoint(f"modify event(s): {', '.join(event_titles)}")
 
-    for event in modified_events:
-        event_report.single_event_view(active_context_name, event)
+    event_report.multi_event_view(active_context_name, modified_events)
 
     if config["cache_view"]:
         show_cached_dispatch()
@@ -340,58 +355,55 @@ def delete(id: str) -> None:
     for event_id in ids:
         real_id: EntityId = ID_MAP_REPO.get_real_id("events", event_id)
 
-        EVENT_REPO.modify_event(
-            real_id,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            now_utc(),
-            None,
-            None,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-        )
-
-        event = EVENT_REPO.get_event(real_id)
+        event = EVENT_REPO.modify_event(real_id, deleted=now_utc())
         deleted_events.append(event)
 
     if config["use_git_versioning"]:
         event_titles = [f"{e['id']}: {e['title']}" for e in deleted_events]
         version.create_data_checkpoint(f"delete event(s): {', '.join(event_titles)}")
 
-    for event in deleted_events:
-        event_report.single_event_view(active_context_name, event)
+    event_report.multi_event_view(active_context_name, deleted_events)
 
     if config["cache_view"]:
         show_cached_dispatch()
 
 
+def _fetch_ical_events(
+    ics_path: str, start: pendulum.DateTime, end: pendulum.DateTime
+) -> list[icalevents.icalparser.Event]:
+    """Fetch the events of a single iCal URL or file within [start, end]."""
+    from pathlib import Path
+
+    # Determine if this is a URL or file path
+    is_url = ics_path.startswith(("http://", "https://"))
+
+    # Check if this is an iCloud URL (needs fix_apple=True)
+    # fix_apple = is_url and "icloud.com" in ics_path.lower()
+    fix_apple = True
+
+    if is_url:
+        return icalevents.icalevents.events(
+            url=ics_path,
+            start=start,
+            end=end,
+            fix_apple=fix_apple,
+        )
+    return icalevents.icalevents.events(
+        file=Path(ics_path),
+        start=start,
+        end=end,
+    )
+
+
 @app.command("sync-ics, si")
 def sync_ics() -> None:
     """Sync events from iCal sources configured in config.ics_paths."""
-    from pathlib import Path
-
-    from rich.console import Console
+    from concurrent.futures import ThreadPoolExecutor
 
     version = Version()
 
     config = CONFIGURATION_REPO.get_config()
     active_context = CONTEXT_REPO.get_active_context()
-    console = Console()
 
     ics_paths = config["ics_paths"]
     if ics_paths is None or len(ics_paths) == 0:
@@ -404,35 +416,25 @@ def sync_ics() -> None:
 
     events_created = 0
     events_updated = 0
+    events_unchanged = 0
 
-    # Get auto-added tags from active context
+    # Read context and config values used inside the sync loop once
     context_tags = active_context["auto_added_tags"]
+    context_projects = active_context["auto_added_projects"]
+    random_color_for_events = config["random_color_for_events"]
 
-    for ics_path in ics_paths:
+    # Fetch every calendar concurrently; the results are applied serially below
+    with ThreadPoolExecutor(max_workers=min(8, len(ics_paths))) as executor:
+        fetches = [
+            executor.submit(_fetch_ical_events, ics_path, start_date, end_date)
+            for ics_path in ics_paths
+        ]
+
+    for ics_path, fetch in zip(ics_paths, fetches):
         console.print(f"[cyan]Syncing from: {ics_path}[/cyan]")
 
         try:
-            # Determine if this is a URL or file path
-            is_url = ics_path.startswith("http://") or ics_path.startswith("https://")
-
-            # Check if this is an iCloud URL (needs fix_apple=True)
-            # fix_apple = "icloud.com" in ics_path.lower() if is_url else False
-            fix_apple = True
-
-            # Get events from the iCal source
-            if is_url:
-                ical_events = icalevents.icalevents.events(
-                    url=ics_path,
-                    start=start_date,
-                    end=end_date,
-                    fix_apple=fix_apple,
-                )
-            else:
-                ical_events = icalevents.icalevents.events(
-                    file=Path(ics_path),
-                    start=start_date,
-                    end=end_date,
-                )
+            ical_events = fetch.result()
 
             for ical_event in ical_events:
                 # Skip events without a start time
@@ -465,38 +467,33 @@ def sync_ics() -> None:
                         else []
                     )
                     merged_tags = list(
-                        set(
-                            existing_tags
-                            + (context_tags if context_tags is not None else [])
-                        )
+                        dict.fromkeys(chain(existing_tags, context_tags or ()))
                     )
                     updated_tags = merged_tags if len(merged_tags) > 0 else None
 
+                    # Skip the write when the stored event already matches the calendar
+                    if (
+                        existing_event["title"] == ical_event.summary
+                        and existing_event["description"] == ical_event.description
+                        and existing_event["location"] == ical_event.location
+                        and existing_event["all_day"] == all_day
+                        and existing_event["tags"] == updated_tags
+                    ):
+                        events_unchanged += 1
+                        continue
+
                     # Update existing event (excluding deleted and created)
                     EVENT_REPO.modify_event(
                         cast(EntityId, existing_event["id"]),
-                        ical_event.summary,
-                        ical_event.description,
-                        ical_event.location,
-                        None,  # projects
-                        updated_tags,  # tags
-                        None,  # color
-                        event_start,
-                        event_end,
-                        all_day,
-                        None,  # deleted
-                        ics_path,  # ical_source
-                        ical_event.uid,  # ical_uid
-                        False,  # remove_title
-                        False,  # remove_description
-                        False,  # remove_location
-                        False,  # remove_projects
-                        False,  # remove_tags
-                        False,  # remove_color
-                        False,  # remove_end
-                        False,  # remove_deleted
-                        False,  # remove_ical_source
-                        False,  # remove_ical_uid
+                        title=ical_event.summary,
+                        description=ical_event.description,
+                        location=ical_event.location,
+                        tags=updated_tags,
+                        start=event_start,
+                        end=event_end,
+                        all_day=all_day,
+                        ical_source=ics_path,
+                        ical_uid=ical_event.uid,
                     )
                     events_updated += 1
                 else:
@@ -513,11 +510,11 @@ def sync_ics() -> None:
                     new_event["tags"] = context_tags
 
                     # Apply auto_added_projects from context
-                    if active_context["auto_added_projects"] is not None:
-                        new_event["projects"] = active_context["auto_added_projects"]
+                    if context_projects is not None:
+                        new_event["projects"] = context_projects
 
                     # Apply random color if configured
-                    if config["random_color_for_events"]:
+                    if random_color_for_events:
                         new_event["color"] = get_random_color()
 
                     EVENT_REPO.save_new_event(new_event)
@@ -528,12 +525,14 @@ def sync_ics() -> None:
             raise e
 
     console.print(
-        f"[green]Sync complete: {events_created} created, {events_updated} updated[/green]"
+        f"[green]Sync complete: {events_created} created, {events_updated} updated, "
+        f"{events_unchanged} unchanged[/green]"
     )
 
     if config["use_git_versioning"]:
         version.create_data_checkpoint(
-            f"sync ics: {events_created} created, {events_updated} updated"
+            f"sync ics: {events_created} created, {events_updated} updated, "
+            f"{events_unchanged} unchanged"
         )
 
     if config["cache_view"]:
@@ -543,12 +542,9 @@ def sync_ics() -> None:
 @app.command("hard-delete-ics-events, hd")
 def hard_delete_ics_events() -> None:
     """Permanently delete all events imported from iCal sources."""
-    from rich.console import Console
-
     version = Version()
 
     config = CONFIGURATION_REPO.get_config()
-    console = Console()
 
     # Confirm with the user before proceeding
     console.print(
@@ -628,14 +624,14 @@ def log(
         timestamp=timestamp,
         add_tags=add_tags,
         color=None,
+        config=config,
+        active_context=active_context,
     )
 
-    log_id = LOG_REPO.save_new_log(log_entry)
+    new_log = LOG_REPO.save_new_log(log_entry)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add log for event {real_id}: {log_id}")
-
-    new_log = LOG_REPO.get_log(log_id)
+        version.create_data_checkpoint(f"add log for event {real_id}: {new_log['id']}")
 
     log_report.single_log_report(active_context_name, new_log)
 
@@ -748,12 +744,12 @@ def note(
         # Prompt for filename
         external_filename = typer.prompt("Enter filename (without extension)")
 
-    note_id = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
+    new_note = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add note for event {real_id}: {note_id}")
-
-    new_note = NOTE_REPO.get_note(note_id)
+        version.create_data_checkpoint(
+            f"add note for event {real_id}: {new_note['id']}"
+        )
 
     if active_context_name is None:
         raise ValueError("context name cannot be None")
@@ -767,12 +763,9 @@ def note(
 @app.command("color, co")
 def color() -> None:
     """Add random colors to all events with null colors."""
-    from rich.console import Console
-
     version = Version()
 
     config = CONFIGURATION_REPO.get_config()
-    console = Console()
 
     # Get all events
     all_events = EVENT_REPO.get_all_events()
@@ -789,28 +782,7 @@ def color() -> None:
     for event in events_without_color:
         EVENT_REPO.modify_event(
             event["id"],  # type: ignore[arg-type]
-            None,  # title
-            None,  # description
-            None,  # location
-            None,  # projects
-            None,  # tags
-            get_random_color(),  # color
-            None,  # start
-            None,  # end
-            None,  # all_day
-            None,  # deleted
-            None,  # ical_source
-            None,  # ical_uid
-            False,  # remove_title
-            False,  # remove_description
-            False,  # remove_location
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_color
-            False,  # remove_end
-            False,  # remove_deleted
-            False,  # remove_ical_source
-            False,  # remove_ical_uid
+            color=get_random_color(),
         )
 
     console.print(
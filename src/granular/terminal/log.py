@@ -5,8 +5,6 @@ from typing import Annotated, Optional
 import pendulum
 import typer
 
-from granular.model.entity_id import EntityId
-from granular.model.entity_type import EntityType
 from granular.repository.configuration import (
     CONFIGURATION_REPO,
 )
@@ -16,7 +14,13 @@ from granular.repository.log import LOG_REPO
 from granular.service.log import create_log_for_entity
 from granular.terminal.completion import complete_project, complete_tag
 from granular.terminal.custom_typer import ContextAwareTyperGroup
-from granular.terminal.parse import open_editor_for_text, parse_datetime, parse_id_list
+from granular.terminal.parse import (
+    merge_context_values,
+    open_editor_for_text,
+    parse_datetime,
+    parse_id_list,
+    resolve_reference,
+)
 from granular.time import now_utc
 from granular.version.version import Version
 from granular.view.terminal_dispatch import show_cached_dispatch
@@ -64,51 +68,19 @@ def add(
     """
     Add a log entry using an editor.
     """
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     config = CONFIGURATION_REPO.get_config()
 
-    # Validate that only one reference is provided
-    reference_count = sum(
-        [
-            ref_task is not None,
-            ref_time_audit is not None,
-            ref_event is not None,
-        ]
+    # Validate that only one reference is provided and convert synthetic_id to real_id
+    reference_type, reference_id = resolve_reference(
+        "log", ref_task, ref_time_audit, ref_event
     )
-    if reference_count > 1:
-        raise ValueError("A log can only reference one entity at a time")
-
-    # Determine reference_type and reference_id (convert synthetic_id to real_id)
-    reference_type: Optional[str] = None
-    reference_id: Optional[EntityId] = None
-
-    if ref_task is not None:
-        reference_type = EntityType.TASK
-        reference_id = ID_MAP_REPO.get_real_id("tasks", ref_task)
-    elif ref_time_audit is not None:
-        reference_type = EntityType.TIME_AUDIT
-        reference_id = ID_MAP_REPO.get_real_id("time_audits", ref_time_audit)
-    elif ref_event is not None:
-        reference_type = EntityType.EVENT
-        reference_id = ID_MAP_REPO.get_real_id("events", ref_event)
 
     # Merge tags with active context
-    log_tags = active_context["auto_added_tags"]
-    if tags is not None:
-        if log_tags is None:
-            log_tags = tags
-        else:
-            log_tags += tags
+    log_tags = merge_context_values(active_context["auto_added_tags"], tags)
 
     # Determine projects: merge auto_added_projects from context with provided projects
-    log_projects = active_context["auto_added_projects"]
-    if projects is not None:
-        if log_projects is None:
-            log_projects = projects
-        else:
-            log_projects += projects
+    log_projects = merge_context_values(active_context["auto_added_projects"], projects)
 
     # Open editor to get log text
     text = open_editor_for_text()
@@ -128,14 +100,14 @@ def add(
         timestamp=timestamp,
         add_tags=None,  # Already merged above
         color=color,
+        config=config,
+        active_context=active_context,
     )
 
-    id = LOG_REPO.save_new_log(log)
+    new_log = LOG_REPO.save_new_log(log)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add log: {id}")
-
-    new_log = LOG_REPO.get_log(id)
+        Version().create_data_checkpoint(f"add log: {new_log['id']}")
 
     log_report.single_log_report(active_context["name"], new_log)
 
@@ -226,56 +198,51 @@ def modify(
     Modify a log entry
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Validate that only one reference is provided
-    reference_count = sum(
-        [
-            ref_task is not None,
-            ref_time_audit is not None,
-            ref_event is not None,
-        ]
+    # Validate that only one reference is provided and convert synthetic_id to real_id
+    reference_type, reference_id = resolve_reference(
+        "log", ref_task, ref_time_audit, ref_event
     )
-    if reference_count > 1:
-        raise ValueError("A log can only reference one entity at a time")
-
-    # Determine reference_type and reference_id (convert synthetic_id to real_id)
-    reference_type: Optional[str] = None
-    reference_id: Optional[EntityId] = None
-
-    if ref_task is not None:
-        reference_type = EntityType.TASK
-        reference_id = ID_MAP_REPO.get_real_id("tasks", ref_task)
-    elif ref_time_audit is not None:
-        reference_type = EntityType.TIME_AUDIT
-        reference_id = ID_MAP_REPO.get_real_id("time_audits", ref_time_audit)
-    elif ref_event is not None:
-        reference_type = EntityType.EVENT
-        reference_id = ID_MAP_REPO.get_real_id("events", ref_event)
+
+    # Removals are checked once per tag/project of every log, so use sets
+    remove_tag_set = frozenset(remove_tag_list) if remove_tag_list is not None else None
+    remove_project_set = (
+        frozenset(remove_project_list) if remove_project_list is not None else None
+    )
+
+    # Only tag, project and text edits need the stored log
+    edit_tags = add_tags is not None or remove_tag_list is not None
+    edit_projects = add_projects is not None or remove_project_list is not None
 
     # Process each log
     modified_logs = []
-    for log_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("logs", log_id)
+    real_ids = ID_MAP_REPO.get_real_ids("logs", ids)
+    for real_id in real_ids.values():
+        current_log = (
+            LOG_REPO.get_log(real_id)
+            if edit_tags or edit_projects or edit_text
+            else None
+        )
 
         # Handle tag modifications
         updated_tags = None
-        if add_tags is not None or remove_tag_list is not None:
-            log = LOG_REPO.get_log(real_id)
-            current_tags = log["tags"] if log["tags"] is not None else []
-            updated_tags = list(current_tags)
-
-            if add_tags is not None:
-                updated_tags.extend(add_tags)
-
-            if remove_tag_list is not None:
+        if edit_tags:
+            assert current_log is not None
+            current_tags = (
+                current_log["tags"] if current_log["tags"] is not None else []
+            )
+            # Build the combined list in one allocation; the row is already a copy
+            updated_tags = (
+                [*current_tags, *add_tags] if add_tags is not None else current_tags
+            )
+
+            if remove_tag_set is not None:
                 updated_tags = [
-                    tag for tag in updated_tags if tag not in remove_tag_list
+                    tag for tag in updated_tags if tag not in remove_tag_set
                 ]
 
             # Set to None if empty, otherwise keep the list
@@ -284,23 +251,29 @@ def modify(
         # Handle text editing
         text = None
         if edit_text:
-            log = LOG_REPO.get_log(real_id)
-            current_text = log["text"] if log["text"] is not None else ""
+            assert current_log is not None
+            current_text = (
+                current_log["text"] if current_log["text"] is not None else ""
+            )
             text = open_editor_for_text(current_text)
             if text is None:
                 typer.echo("Text editing cancelled")
 
         # Handle project modifications
         updated_projects = None
-        if add_projects is not None or remove_project_list is not None:
-            log = LOG_REPO.get_log(real_id)
-            current_projects = log["projects"] if log["projects"] is not None else []
-            updated_projects = list(current_projects)
-            if add_projects is not None:
-                updated_projects.extend(add_projects)
-            if remove_project_list is not None:
+        if edit_projects:
+            assert current_log is not None
+            current_projects = (
+                current_log["projects"] if current_log["projects"] is not None else []
+            )
+            updated_projects = (
+                [*current_projects, *add_projects]
+                if add_projects is not None
+                else current_projects
+            )
+            if remove_project_set is not None:
                 updated_projects = [
-                    p for p in updated_projects if p not in remove_project_list
+                    p for p in updated_projects if p not in remove_project_set
                 ]
             updated_projects = updated_projects if len(updated_projects) > 0 else None
 
@@ -308,7 +281,7 @@ def modify(
         remove_reference_id = remove_reference
         remove_reference_type = remove_reference
 
-        LOG_REPO.modify_log(
+        log = LOG_REPO.modify_log(
             real_id,
             reference_id,
             reference_type,
@@ -327,17 +300,14 @@ def modify(
             remove_color,
             remove_deleted,
         )
-
-        log = LOG_REPO.get_log(real_id)
         modified_logs.append(log)
 
     if config["use_git_versioning"]:
         log_ids = [str(lg["id"]) for lg in modified_logs]
-        version.create_data_checkpoint(f"modify log(s): {', '.join(log_ids)}")
+        Version().create_data_checkpoint(f"modify log(s): {', '.join(log_ids)}")
 
     assert active_context["name"] is not None
-    for log in modified_logs:
-        log_report.single_log_report(active_context["name"], log)
+    log_report.multi_log_report(active_context["name"], modified_logs)
 
     if config["cache_view"]:
         show_cached_dispatch()
@@ -349,48 +319,20 @@ def delete(id: str) -> None:
     Delete a log entry
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Process each log
-    deleted_logs = []
-    for log_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("logs", log_id)
-
-        LOG_REPO.modify_log(
-            real_id,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            now_utc(),
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-        )
-
-        log = LOG_REPO.get_log(real_id)
-        deleted_logs.append(log)
+    real_ids = ID_MAP_REPO.get_real_ids("logs", ids)
+    deleted_logs = LOG_REPO.modify_logs(list(real_ids.values()), deleted=now_utc())
 
     if config["use_git_versioning"]:
         log_ids = [str(lg["id"]) for lg in deleted_logs]
-        version.create_data_checkpoint(f"delete log(s): {', '.join(log_ids)}")
+        Version().create_data_checkpoint(f"delete log(s): {', '.join(log_ids)}")
 
     assert active_context["name"] is not None
-    for log in deleted_logs:
-        log_report.single_log_report(active_context["name"], log)
+    log_report.multi_log_report(active_context["name"], deleted_logs)
 
     if config["cache_view"]:
         show_cached_dispatch()
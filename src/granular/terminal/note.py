@@ -1,12 +1,12 @@
 # SPDX-License-Identifier: MIT
 
+import os
+import subprocess
 from typing import Annotated, Optional, cast
 
 import pendulum
 import typer
 
-from granular.model.entity_id import EntityId
-from granular.model.entity_type import EntityType
 from granular.repository.configuration import (
     CONFIGURATION_REPO,
 )
@@ -17,9 +17,11 @@ from granular.template.note import get_note_template
 from granular.terminal.completion import complete_project, complete_tag
 from granular.terminal.custom_typer import ContextAwareTyperGroup
 from granular.terminal.parse import (
+    merge_context_values,
     open_editor_for_text,
     parse_datetime,
     parse_id_list,
+    resolve_reference,
 )
 from granular.time import now_utc, python_to_pendulum_utc_optional
 from granular.version.version import Version
@@ -85,41 +87,15 @@ def add(
         ),
     ] = None,
 ) -> None:
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
     config = CONFIGURATION_REPO.get_config()
 
-    # Validate that only one reference is provided
-    reference_count = sum(
-        [
-            ref_task is not None,
-            ref_time_audit is not None,
-            ref_event is not None,
-            ref_timespan is not None,
-        ]
+    # Validate that only one reference is provided and convert synthetic_id to real_id
+    reference_type, reference_id = resolve_reference(
+        "note", ref_task, ref_time_audit, ref_event, ref_timespan
     )
-    if reference_count > 1:
-        raise ValueError("A note can only reference one entity at a time")
-
-    # Determine reference_type and reference_id (convert synthetic_id to real_id)
-    reference_type: Optional[str] = None
-    reference_id: Optional[EntityId] = None
-
-    if ref_task is not None:
-        reference_type = EntityType.TASK
-        reference_id = ID_MAP_REPO.get_real_id("tasks", ref_task)
-    elif ref_time_audit is not None:
-        reference_type = EntityType.TIME_AUDIT
-        reference_id = ID_MAP_REPO.get_real_id("time_audits", ref_time_audit)
-    elif ref_event is not None:
-        reference_type = EntityType.EVENT
-        reference_id = ID_MAP_REPO.get_real_id("events", ref_event)
-    elif ref_timespan is not None:
-        reference_type = EntityType.TIMESPAN
-        reference_id = ID_MAP_REPO.get_real_id("timespans", ref_timespan)
 
     # Open editor for note text
     text = open_editor_for_text()
@@ -127,20 +103,12 @@ def add(
         typer.echo("Note creation cancelled (no text provided)")
         return
 
-    note_tags = active_context["auto_added_tags"]
-    if tags is not None:
-        if note_tags is None:
-            note_tags = tags
-        else:
-            note_tags += tags
+    note_tags = merge_context_values(active_context["auto_added_tags"], tags)
 
     # Determine projects: merge auto_added_projects from context with provided projects
-    note_projects = active_context["auto_added_projects"]
-    if projects is not None:
-        if note_projects is None:
-            note_projects = projects
-        else:
-            note_projects += projects
+    note_projects = merge_context_values(
+        active_context["auto_added_projects"], projects
+    )
 
     note = get_note_template()
     note["reference_id"] = reference_id
@@ -172,14 +140,12 @@ def add(
         # Prompt for filename
         external_filename = typer.prompt("Enter filename (without extension)")
 
-    id = NOTE_REPO.save_new_note(note, external_filename, note_folder_name)
+    new_note = NOTE_REPO.save_new_note(note, external_filename, note_folder_name)
 
     if config["use_git_versioning"]:
         # Truncate text for commit message
         text_preview = text[:50] + "..." if len(text) > 50 else text
-        version.create_data_checkpoint(f"add note: {id}: {text_preview}")
-
-    new_note = NOTE_REPO.get_note(id)
+        Version().create_data_checkpoint(f"add note: {new_note['id']}: {text_preview}")
 
     if active_context_name is None:
         raise ValueError("context name cannot be None")
@@ -281,8 +247,6 @@ def modify(
     remove_color: Annotated[bool, typer.Option("--remove-color", "-rc")] = False,
 ) -> None:
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
@@ -290,53 +254,46 @@ def modify(
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Validate that only one reference is provided
-    reference_count = sum(
-        [
-            ref_task is not None,
-            ref_time_audit is not None,
-            ref_event is not None,
-            ref_timespan is not None,
-        ]
+    # Validate that only one reference is provided and convert synthetic_id to real_id
+    reference_type, reference_id = resolve_reference(
+        "note", ref_task, ref_time_audit, ref_event, ref_timespan
     )
-    if reference_count > 1:
-        raise ValueError("A note can only reference one entity at a time")
-
-    # Determine reference_type and reference_id (convert synthetic_id to real_id)
-    reference_type: Optional[str] = None
-    reference_id: Optional[EntityId] = None
-
-    if ref_task is not None:
-        reference_type = EntityType.TASK
-        reference_id = ID_MAP_REPO.get_real_id("tasks", ref_task)
-    elif ref_time_audit is not None:
-        reference_type = EntityType.TIME_AUDIT
-        reference_id = ID_MAP_REPO.get_real_id("time_audits", ref_time_audit)
-    elif ref_event is not None:
-        reference_type = EntityType.EVENT
-        reference_id = ID_MAP_REPO.get_real_id("events", ref_event)
-    elif ref_timespan is not None:
-        reference_type = EntityType.TIMESPAN
-        reference_id = ID_MAP_REPO.get_real_id("timespans", ref_timespan)
+
+    # Removals are checked once per tag/project of every note, so use sets
+    remove_tag_set = frozenset(remove_tag_list) if remove_tag_list is not None else None
+    remove_project_set = (
+        frozenset(remove_project_list) if remove_project_list is not None else None
+    )
+
+    # Only tag, project and text edits need the stored note
+    edit_tags = add_tags is not None or remove_tag_list is not None
+    edit_projects = add_projects is not None or remove_project_list is not None
 
     # Process each note
     modified_notes = []
-    for note_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("notes", note_id)
+    real_ids = ID_MAP_REPO.get_real_ids("notes", ids)
+    for real_id in real_ids.values():
+        current_note = (
+            NOTE_REPO.get_note(real_id)
+            if edit_tags or edit_projects or edit_text
+            else None
+        )
 
         # Handle tag modifications
         updated_tags = None
-        if add_tags is not None or remove_tag_list is not None:
-            note = NOTE_REPO.get_note(real_id)
-            current_tags = note["tags"] if note["tags"] is not None else []
-            updated_tags = list(current_tags)
-
-            if add_tags is not None:
-                updated_tags.extend(add_tags)
+        if edit_tags:
+            assert current_note is not None
+            current_tags = (
+                current_note["tags"] if current_note["tags"] is not None else []
+            )
+            # Build the combined list in one allocation; the row is already a copy
+            updated_tags = (
+                [*current_tags, *add_tags] if add_tags is not None else current_tags
+            )
 
-            if remove_tag_list is not None:
+            if remove_tag_set is not None:
                 updated_tags = [
-                    tag for tag in updated_tags if tag not in remove_tag_list
+                    tag for tag in updated_tags if tag not in remove_tag_set
                 ]
 
             # Set to None if empty, otherwise keep the list
@@ -345,17 +302,18 @@ def modify(
         # Handle text editing
         text = None
         if edit_text:
-            note = NOTE_REPO.get_note(real_id)
-            current_text = note["text"] if note["text"] is not None else ""
+            assert current_note is not None
+            current_text = (
+                current_note["text"] if current_note["text"] is not None else ""
+            )
 
             # Check if external note
-            if note.get("external_file_path"):
+            if current_note.get("external_file_path"):
                 # Open the actual external file in editor
-                import os
-                import subprocess
-
                 # Resolve absolute path
-                absolute_path = NOTE_REPO._resolve_external_file_path(note, config)
+                absolute_path = NOTE_REPO._resolve_external_file_path(
+                    current_note, config
+                )
 
                 # Open editor on the actual file
                 editor = os.environ.get("EDITOR", "nano")
@@ -372,15 +330,19 @@ def modify(
 
         # Handle project modifications
         updated_projects = None
-        if add_projects is not None or remove_project_list is not None:
-            note = NOTE_REPO.get_note(real_id)
-            current_projects = note["projects"] if note["projects"] is not None else []
-            updated_projects = list(current_projects)
-            if add_projects is not None:
-                updated_projects.extend(add_projects)
-            if remove_project_list is not None:
+        if edit_projects:
+            assert current_note is not None
+            current_projects = (
+                current_note["projects"] if current_note["projects"] is not None else []
+            )
+            updated_projects = (
+                [*current_projects, *add_projects]
+                if add_projects is not None
+                else current_projects
+            )
+            if remove_project_set is not None:
                 updated_projects = [
-                    p for p in updated_projects if p not in remove_project_list
+                    p for p in updated_projects if p not in remove_project_set
                 ]
             updated_projects = updated_projects if len(updated_projects) > 0 else None
 
@@ -388,7 +350,7 @@ def modify(
         remove_reference_id = remove_reference
         remove_reference_type = remove_reference
 
-        NOTE_REPO.modify_note(
+        note = NOTE_REPO.modify_note(
             real_id,
             reference_id,
             reference_type,
@@ -407,8 +369,6 @@ def modify(
             remove_text,
             remove_color,
         )
-
-        note = NOTE_REPO.get_note(real_id)
         modified_notes.append(note)
 
     if config["use_git_versioning"]:
@@ -416,10 +376,9 @@ def modify(
             f"{n['id']}: {(n['text'][:50] + '...' if len(n['text']) > 50 else n['text']) if n['text'] is not None else ''}"
             for n in modified_notes
         ]
-        version.create_data_checkpoint(f"modify note(s): {', '.join(note_previews)}")
+        Version().create_data_checkpoint(f"modify note(s): {', '.join(note_previews)}")
 
-    for note in modified_notes:
-        note_report.single_note_report(active_context_name, note)
+    note_report.multi_note_report(active_context_name, modified_notes)
 
     if config["cache_view"]:
         show_cached_dispatch()
@@ -428,8 +387,6 @@ def modify(
 @app.command("delete, d", no_args_is_help=True)
 def delete(id: str) -> None:
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
@@ -437,40 +394,14 @@ def delete(id: str) -> None:
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Process each note
-    deleted_notes = []
-    for note_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("notes", note_id)
-
-        NOTE_REPO.modify_note(
-            real_id,
-            None,  # reference_id
-            None,  # reference_type
-            None,  # timestamp
-            now_utc(),  # deleted
-            None,  # tags
-            None,  # projects
-            None,  # text
-            None,  # color
-            False,  # remove_reference_id
-            False,  # remove_reference_type
-            False,  # remove_timestamp
-            False,  # remove_deleted
-            False,  # remove_tags
-            False,  # remove_projects
-            False,  # remove_text
-            False,  # remove_color
-        )
-
-        note = NOTE_REPO.get_note(real_id)
-        deleted_notes.append(note)
+    real_ids = ID_MAP_REPO.get_real_ids("notes", ids)
+    deleted_notes = NOTE_REPO.modify_notes(list(real_ids.values()), deleted=now_utc())
 
     if config["use_git_versioning"]:
         note_ids = [str(n["id"]) for n in deleted_notes]
-        version.create_data_checkpoint(f"delete note(s): {', '.join(note_ids)}")
+        Version().create_data_checkpoint(f"delete note(s): {', '.join(note_ids)}")
 
-    for note in deleted_notes:
-        note_report.single_note_report(active_context_name, note)
+    note_report.multi_note_report(active_context_name, deleted_notes)
 
     if config["cache_view"]:
         show_cached_dispatch()
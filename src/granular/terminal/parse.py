@@ -1,15 +1,59 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import re
 import subprocess
 import tempfile
+from functools import lru_cache
 from typing import Optional
 
 import pendulum
 import typer
 
-from granular.time import datetime_from_str_utc
+from granular.model.entity_id import EntityId
+from granular.model.entity_type import EntityType
+from granular.repository.id_map import ID_MAP_REPO
+from granular.time import (
+    datetime_from_str_utc,
+    local_day_time_utc,
+    local_today,
+    now_utc,
+)
+
+# Day keywords are looked up before any pattern matching
+_DAY_KEYWORDS: dict[str, int] = {
+    "today": 0,
+    "t": 0,
+    "yesterday": -1,
+    "y": -1,
+    "tomorrow": 1,
+    "o": 1,
+}
+
+
+def _looks_like_iso_date(value: str) -> bool:
+    """Check for a YYYY-MM-DD prefix; anything after it is left to the parser."""
+    return (
+        len(value) >= 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    )
+
+
+def _split_hour_minute(value: str) -> Optional[tuple[int, int]]:
+    """Split an (H)H:mm string into (hour, minute) without range checks."""
+    hour_str, separator, minute_str = value.partition(":")
+    if (
+        separator
+        and 1 <= len(hour_str) <= 2
+        and len(minute_str) == 2
+        and hour_str.isdecimal()
+        and minute_str.isdecimal()
+    ):
+        return int(hour_str), int(minute_str)
+    return None
 
 
 def parse_datetime(datetime_param: Optional[str | int]) -> Optional[pendulum.DateTime]:
@@ -18,15 +62,27 @@ def parse_datetime(datetime_param: Optional[str | int]) -> Optional[pendulum.Dat
 
     datetime = str(datetime_param)
 
+    # The current instant must never be served from the cache
+    if datetime == "now" or datetime == "n":
+        return now_utc()
+
+    return _parse_datetime_str(datetime)
+
+
+@lru_cache(maxsize=256)
+def _parse_datetime_str(datetime: str) -> pendulum.DateTime:
+    keyword_offset = _DAY_KEYWORDS.get(datetime)
+    if keyword_offset is not None:
+        return local_day_time_utc(keyword_offset)
+
     # Match YYYY-MM-DD format (with optional time component)
-    if re.match(r"\d{4}-\d{2}-\d{2}", datetime):
+    if _looks_like_iso_date(datetime):
         return datetime_from_str_utc(datetime)
 
     # Match (H)H:mm format (time only, use today's date)
-    time_match = re.match(r"^(\d{1,2}):(\d{2})$", datetime)
-    if time_match:
-        hour = int(time_match.group(1))
-        minute = int(time_match.group(2))
+    hour_minute = _split_hour_minute(datetime)
+    if hour_minute is not None:
+        hour, minute = hour_minute
 
         # Validate hour and minute ranges
         if hour < 0 or hour > 23:
@@ -35,41 +91,24 @@ def parse_datetime(datetime_param: Optional[str | int]) -> Optional[pendulum.Dat
             raise typer.BadParameter(f"Minute must be between 0 and 59, got {minute}")
 
         # Create datetime with today's date in local timezone, then convert to UTC
-        pendulum_date_time = pendulum.today("local").set(
-            hour=hour, minute=minute, second=0, microsecond=0
-        )
-        pendulum_date_time = pendulum_date_time.in_tz("UTC")
-        return pendulum_date_time
+        return local_day_time_utc(hour=hour, minute=minute)
 
     # Match numeric input for relative days (e.g., "1", "-1", "365")
-    if re.match(r"^-?\d+$", datetime):
+    if (datetime[1:] if datetime.startswith("-") else datetime).isdecimal():
         try:
-            days_offset = int(datetime)
-            pendulum_date_time = pendulum.today().add(days=days_offset).start_of("day")
-            pendulum_date_time = pendulum_date_time.in_tz("UTC")
-            return pendulum_date_time
+            return local_day_time_utc(int(datetime))
         except Exception as e:
             raise typer.BadParameter(f"Invalid day offset: {e}")
 
-    if datetime == "now" or datetime == "n":
-        pendulum_date_time = pendulum.now()
-        pendulum_date_time = pendulum_date_time.in_tz("UTC")
-        return pendulum_date_time
-    if datetime == "today" or datetime == "t":
-        pendulum_date_time = pendulum.today().start_of("day")
-        pendulum_date_time = pendulum_date_time.in_tz("UTC")
-        return pendulum_date_time
-    if datetime == "yesterday" or datetime == "y":
-        pendulum_date_time = pendulum.yesterday().start_of("day")
-        pendulum_date_time = pendulum_date_time.in_tz("UTC")
-        return pendulum_date_time
-    if datetime == "tomorrow" or datetime == "o":
-        pendulum_date_time = pendulum.tomorrow().start_of("day")
-        pendulum_date_time = pendulum_date_time.in_tz("UTC")
-        return pendulum_date_time
     raise typer.BadParameter("Incorrect datetime format")
 
 
+def reset_relative_dates() -> None:
+    """Forget the cached local date and the datetimes parsed relative to it."""
+    local_today.cache_clear()
+    _parse_datetime_str.cache_clear()
+
+
 def parse_time(time_str: Optional[str]) -> Optional[tuple[int, int]]:
     """
     Parse a time string in (H)H:mm format and return a tuple of (hour, minute).
@@ -87,14 +126,13 @@ def parse_time(time_str: Optional[str]) -> Optional[tuple[int, int]]:
         return None
 
     # Match (H)H:mm format
-    time_match = re.match(r"^(\d{1,2}):(\d{2})$", time_str)
-    if not time_match:
+    hour_minute = _split_hour_minute(time_str)
+    if hour_minute is None:
         raise typer.BadParameter(
             f"Time must be in HH:mm format (e.g., 8:00 or 17:30), got '{time_str}'"
         )
 
-    hour = int(time_match.group(1))
-    minute = int(time_match.group(2))
+    hour, minute = hour_minute
 
     # Validate hour and minute ranges
     if hour < 0 or hour > 23:
@@ -119,11 +157,25 @@ def parse_id_list(id_param: str) -> list[int]:
     Raises:
         typer.BadParameter: If any ID is not a valid integer or range format is invalid
     """
+    return list(_parse_id_tuple(id_param))
+
+
+@lru_cache(maxsize=128)
+def _parse_id_tuple(id_param: str) -> tuple[int, ...]:
+    # Cached as a tuple so callers can never mutate a shared result
+    # Fast path for plain id lists; anything unusual falls through to the
+    # token-by-token parse below, which also produces the error messages
+    if "-" not in id_param:
+        try:
+            return tuple(sorted(set(map(int, id_param.split(",")))))
+        except ValueError:
+            pass
+
     # Split by comma and strip whitespace
     id_strings = [s.strip() for s in id_param.split(",")]
 
-    # Convert to integers, handling ranges
-    ids: list[int] = []
+    # Convert to integers, handling ranges; a set deduplicates as we go
+    ids: set[int] = set()
     for id_str in id_strings:
         if not id_str:
             continue
@@ -152,11 +204,11 @@ def parse_id_list(id_param: str) -> list[int]:
                 )
 
             # Add all IDs in range (inclusive)
-            ids.extend(range(start, end + 1))
+            ids.update(range(start, end + 1))
         else:
             # Single ID
             try:
-                ids.append(int(id_str))
+                ids.add(int(id_str))
             except ValueError:
                 raise typer.BadParameter(
                     f"Invalid ID: '{id_str}' is not a valid integer"
@@ -165,8 +217,58 @@ def parse_id_list(id_param: str) -> list[int]:
     if len(ids) == 0:
         raise typer.BadParameter("No valid IDs provided")
 
-    # Remove duplicates and sort
-    return sorted(set(ids))
+    return tuple(sorted(ids))
+
+
+def resolve_reference(
+    entity_label: str,
+    ref_task: Optional[int],
+    ref_time_audit: Optional[int],
+    ref_event: Optional[int],
+    ref_timespan: Optional[int] = None,
+) -> tuple[Optional[str], Optional[EntityId]]:
+    """
+    Resolve the --ref-* options of a command into a reference type and real id.
+
+    Raises:
+        ValueError: If more than one reference is provided
+    """
+    # Most commands pass no reference at all, so count before building anything
+    reference_count = (
+        (ref_task is not None)
+        + (ref_time_audit is not None)
+        + (ref_event is not None)
+        + (ref_timespan is not None)
+    )
+    if reference_count > 1:
+        raise ValueError(f"A {entity_label} can only reference one entity at a time")
+    if reference_count == 0:
+        return None, None
+
+    references = (
+        (ref_task, EntityType.TASK, "tasks"),
+        (ref_time_audit, EntityType.TIME_AUDIT, "time_audits"),
+        (ref_event, EntityType.EVENT, "events"),
+        (ref_timespan, EntityType.TIMESPAN, "timespans"),
+    )
+    for synthetic_id, reference_type, id_map_type in references:
+        if synthetic_id is not None:
+            return reference_type, ID_MAP_REPO.get_real_id(id_map_type, synthetic_id)
+    return None, None
+
+
+def merge_context_values(
+    context_values: Optional[list[str]], cli_values: Optional[list[str]]
+) -> Optional[list[str]]:
+    """
+    Merge the active context's auto-added tags or projects with the ones given
+    on the command line.
+    """
+    if cli_values is None:
+        return context_values
+    if context_values is None:
+        return cli_values
+    return [*context_values, *cli_values]
 
 
 def open_editor_for_text(initial_text: Optional[str] = None) -> Optional[str]:
@@ -185,9 +287,14 @@ def open_editor_for_text(initial_text: Optional[str] = None) -> Optional[str]:
             tf.flush()
 
         subprocess.run([editor, tf.name], check=True)
-        tf.seek(0)
-        text = tf.read()
-        if not text.strip():
+
+        # An empty file needs no read at all
+        if os.fstat(tf.fileno()).st_size == 0:
             return None
+
+        tf.seek(0)
         # Remove trailing newlines but preserve internal empty lines
-        return text.rstrip("\n")
+        text = tf.read().rstrip("\n")
+        if not text or text.isspace():
+            return None
+        return text
@@ -1,15 +1,11 @@
 # SPDX-License-Identifier: MIT
 
-from typing import Annotated, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Annotated, Callable, Optional, TypeVar, cast
 
 import typer
 
-from granular.model.event import Event
-from granular.model.log import Log
-from granular.model.note import Note
-from granular.model.task import Task
-from granular.model.time_audit import TimeAudit
-from granular.model.timespan import Timespan
+from granular.repository.configuration import CONFIGURATION_REPO
 from granular.repository.context import CONTEXT_REPO
 from granular.repository.event import EVENT_REPO
 from granular.repository.log import LOG_REPO
@@ -20,13 +16,29 @@ from granular.repository.timespan import TIMESPAN_REPO
 from granular.service.search import search_entities
 from granular.view.view.views.search import search_results_view
 
+T = TypeVar("T")
+
+
+def _submit_if(
+    executor: ThreadPoolExecutor,
+    enabled: bool,
+    load: Callable[[bool], list[T]],
+    include_deleted: bool,
+) -> Optional[Future[list[T]]]:
+    """Start loading an entity type on the pool, if it is part of the search."""
+    return executor.submit(load, include_deleted) if enabled else None
+
+
+def _result_or_empty(future: Optional[Future[list[T]]]) -> list[T]:
+    return future.result() if future is not None else []
+
 
 def search(
     query: Annotated[str, typer.Argument(help="Search query string")],
     search_in_description: Annotated[
         bool,
         typer.Option(
-            "--search-in-description",
+            "--search-in-description/--no-search-in-description",
             "-d",
             help="Search in description/title/text fields",
         ),
@@ -74,69 +86,47 @@ def search(
         typer.Option("--no-wrap", help="Disable text wrapping in table columns"),
     ] = False,
 ) -> None:
+    # Every entity type has all three fields, so with none enabled nothing can match
+    if not (search_in_description or search_in_tags or search_in_project):
+        raise typer.BadParameter("At least one search field must be enabled")
+
     # Get active context
     active_context = CONTEXT_REPO.get_active_context()
     active_context_name = cast(str, active_context["name"])
 
-    # Retrieve entities based on flags
-    tasks_list: list[Task] = []
-    time_audits_list: list[TimeAudit] = []
-    events_list: list[Event] = []
-    timespans_list: list[Timespan] = []
-    notes_list: list[Note] = []
-    logs_list: list[Log] = []
-
-    if tasks:
-        tasks_list = TASK_REPO.get_all_tasks()
-        # Filter out deleted tasks by default
-        if not include_deleted:
-            tasks_list = [task for task in tasks_list if task["deleted"] is None]
-
-    if time_audits:
-        time_audits_list = TIME_AUDIT_REPO.get_all_time_audits()
-        # Filter out deleted time audits by default
-        if not include_deleted:
-            time_audits_list = [
-                time_audit
-                for time_audit in time_audits_list
-                if time_audit["deleted"] is None
-            ]
-
-    if events:
-        events_list = EVENT_REPO.get_all_events()
-        # Filter out deleted events by default
-        if not include_deleted:
-            events_list = [event for event in events_list if event["deleted"] is None]
-
-    if timespans:
-        timespans_list = TIMESPAN_REPO.get_all_timespans()
-        # Filter out deleted timespans by default
-        if not include_deleted:
-            timespans_list = [
-                timespan for timespan in timespans_list if timespan["deleted"] is None
-            ]
-
+    # Retrieve entities based on flags; deleted ones are dropped by the repositories.
+    # Every repository reads its own directory of files, so the loads run concurrently.
+    # Note loading also reads the configuration, so load that singleton here first
+    # rather than on a worker thread racing the others.
     if notes:
-        notes_list = NOTE_REPO.get_all_notes()
-        # Filter out deleted notes by default
-        if not include_deleted:
-            notes_list = [note for note in notes_list if note["deleted"] is None]
-
-    if logs:
-        logs_list = LOG_REPO.get_all_logs()
-        # Filter out deleted logs by default
-        if not include_deleted:
-            logs_list = [log for log in logs_list if log["deleted"] is None]
+        CONFIGURATION_REPO.get_config()
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        tasks_future = _submit_if(
+            executor, tasks, TASK_REPO.get_all_tasks, include_deleted
+        )
+        time_audits_future = _submit_if(
+            executor, time_audits, TIME_AUDIT_REPO.get_all_time_audits, include_deleted
+        )
+        events_future = _submit_if(
+            executor, events, EVENT_REPO.get_all_events, include_deleted
+        )
+        timespans_future = _submit_if(
+            executor, timespans, TIMESPAN_REPO.get_all_timespans, include_deleted
+        )
+        notes_future = _submit_if(
+            executor, notes, NOTE_REPO.get_all_notes, include_deleted
+        )
+        logs_future = _submit_if(executor, logs, LOG_REPO.get_all_logs, include_deleted)
 
     # Perform search
     results = search_entities(
         query=query,
-        tasks=tasks_list,
-        time_audits=time_audits_list,
-        events=events_list,
-        timespans=timespans_list,
-        notes=notes_list,
-        logs=logs_list,
+        tasks=_result_or_empty(tasks_future),
+        time_audits=_result_or_empty(time_audits_future),
+        events=_result_or_empty(events_future),
+        timespans=_result_or_empty(timespans_future),
+        notes=_result_or_empty(notes_future),
+        logs=_result_or_empty(logs_future),
         search_in_description=search_in_description,
         search_in_tags=search_in_tags,
         search_in_project=search_in_project,
@@ -1,13 +1,17 @@
 # SPDX-License-Identifier: MIT
 
-from typing import Annotated, Optional, cast
+from itertools import chain
+from typing import Annotated, Optional
 
 import pendulum
 import typer
 
-from granular.color import get_random_color
+from granular.color import get_random_color, get_random_colors
+from granular.configuration import Configuration
+from granular.model.context import Context
 from granular.model.entity_id import EntityId
 from granular.model.entity_type import EntityType
+from granular.model.task import Task, TaskStatusField
 from granular.repository.configuration import (
     CONFIGURATION_REPO,
 )
@@ -43,6 +47,27 @@ from granular.view.view.views import time_audit as time_audit_report
 
 app = typer.Typer(cls=ContextAwareTyperGroup, no_args_is_help=True)
 
+# Options shared between commands; Typer copies each one per parameter
+_DATETIME_HELP = "valid inputs: YYYY-MM-DD, now, today, yesterday, tomorrow, or day offset like 1, -1"
+_PRIORITY_OPTION = typer.Option(
+    "--priority",
+    "-pr",
+    callback=validate_priority,
+    help="valid input: 1-5 (1=highest, 5=lowest)",
+)
+_COLOR_OPTION = typer.Option("--color", "-col")
+_ESTIMATE_OPTION = typer.Option(
+    "--estimate", "-e", callback=validate_duration, help="valid input: HH:mm"
+)
+_TIMESPAN_ID_OPTION = typer.Option("--timespan-id", "-ts")
+_SCHEDULED_OPTION = typer.Option(
+    "--scheduled", "-s", parser=parse_datetime, help=_DATETIME_HELP
+)
+_DUE_OPTION = typer.Option("--due", "-u", parser=parse_datetime, help=_DATETIME_HELP)
+_STARTED_OPTION = typer.Option(
+    "--started", "-a", parser=parse_datetime, help=_DATETIME_HELP
+)
+
 
 @app.command("add, a", no_args_is_help=True)
 def add(
@@ -65,56 +90,17 @@ def add(
             autocompletion=complete_tag,
         ),
     ] = None,
-    priority: Annotated[
-        Optional[int],
-        typer.Option(
-            "--priority",
-            "-pr",
-            callback=validate_priority,
-            help="valid input: 1-5 (1=highest, 5=lowest)",
-        ),
-    ] = None,
-    color: Annotated[Optional[str], typer.Option("--color", "-col")] = None,
-    estimate: Annotated[
-        Optional[str],
-        typer.Option(
-            "--estimate", "-e", callback=validate_duration, help="valid input: HH:mm"
-        ),
-    ] = None,
-    scheduled: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--scheduled",
-            "-s",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, now, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
-    due: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--due",
-            "-u",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, now, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
-    started: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--started",
-            "-a",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, now, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
-    timespan_id: Annotated[Optional[int], typer.Option("--timespan-id", "-ts")] = None,
+    priority: Annotated[Optional[int], _PRIORITY_OPTION] = None,
+    color: Annotated[Optional[str], _COLOR_OPTION] = None,
+    estimate: Annotated[Optional[str], _ESTIMATE_OPTION] = None,
+    scheduled: Annotated[Optional[pendulum.DateTime], _SCHEDULED_OPTION] = None,
+    due: Annotated[Optional[pendulum.DateTime], _DUE_OPTION] = None,
+    started: Annotated[Optional[pendulum.DateTime], _STARTED_OPTION] = None,
+    timespan_id: Annotated[Optional[int], _TIMESPAN_ID_OPTION] = None,
 ) -> None:
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
-    active_context_name = cast(str, active_context["name"])
+    active_context_name = CONTEXT_REPO.require_active_context_name()
     config = CONFIGURATION_REPO.get_config()
 
     task_tags = active_context["auto_added_tags"]
@@ -156,14 +142,11 @@ def add(
     id = TASK_REPO.save_new_task(task)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add task: {id}: {description}")
+        Version().create_data_checkpoint(f"add task: {id}: {description}")
 
     new_task = TASK_REPO.get_task(id)
 
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    if active_context_name is None:
-        raise ValueError("context name cannot be None")
+    time_audits = TIME_AUDIT_REPO.get_time_audits_for_tasks([id])
 
     task_report.single_task_view(active_context_name, new_task, time_audits)
 
@@ -177,7 +160,7 @@ def modify(
     cloned_from_id: Annotated[
         Optional[int], typer.Option("--cloned-from-id", "-cfi")
     ] = None,
-    timespan_id: Annotated[Optional[int], typer.Option("--timespan-id", "-ts")] = None,
+    timespan_id: Annotated[Optional[int], _TIMESPAN_ID_OPTION] = None,
     description: Annotated[Optional[str], typer.Option("--description", "-d")] = None,
     add_projects: Annotated[
         Optional[list[str]],
@@ -215,55 +198,18 @@ def modify(
             autocompletion=complete_tag,
         ),
     ] = None,
-    priority: Annotated[
-        Optional[int],
-        typer.Option(
-            "--priority",
-            "-pr",
-            callback=validate_priority,
-            help="valid input: 1-5 (1=highest, 5=lowest)",
-        ),
-    ] = None,
-    estimate: Annotated[
-        Optional[str],
-        typer.Option(
-            "--estimate", "-e", callback=validate_duration, help="valid input: HH:mm"
-        ),
-    ] = None,
-    scheduled: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--scheduled",
-            "-s",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
-    due: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--due",
-            "-u",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
-    started: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--started",
-            "-a",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
+    priority: Annotated[Optional[int], _PRIORITY_OPTION] = None,
+    estimate: Annotated[Optional[str], _ESTIMATE_OPTION] = None,
+    scheduled: Annotated[Optional[pendulum.DateTime], _SCHEDULED_OPTION] = None,
+    due: Annotated[Optional[pendulum.DateTime], _DUE_OPTION] = None,
+    started: Annotated[Optional[pendulum.DateTime], _STARTED_OPTION] = None,
     completed: Annotated[
         Optional[pendulum.DateTime],
         typer.Option(
             "--completed",
             "-c",
             parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
+            help=_DATETIME_HELP,
         ),
     ] = None,
     not_completed: Annotated[
@@ -272,7 +218,7 @@ def modify(
             "--not-completed",
             "-nc",
             parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
+            help=_DATETIME_HELP,
         ),
     ] = None,
     cancelled: Annotated[
@@ -281,7 +227,7 @@ def modify(
             "--cancelled",
             "-ca",
             parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
+            help=_DATETIME_HELP,
         ),
     ] = None,
     deleted: Annotated[
@@ -290,7 +236,7 @@ def modify(
             "--deleted",
             "-del",
             parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
+            help=_DATETIME_HELP,
         ),
     ] = None,
     remove_cloned_from_id: Annotated[
@@ -323,72 +269,60 @@ def modify(
         bool, typer.Option("--remove-cancelled", "-rc")
     ] = False,
     remove_deleted: Annotated[bool, typer.Option("--remove-deleted", "-rdel")] = False,
-    color: Annotated[Optional[str], typer.Option("--color", "-col")] = None,
+    color: Annotated[Optional[str], _COLOR_OPTION] = None,
     remove_color: Annotated[bool, typer.Option("--remove-color", "-rcol")] = False,
 ) -> None:
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
+    active_context_name = CONTEXT_REPO.require_active_context_name()
 
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Process each task
-    modified_tasks = []
-    for task_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
-
-        # Handle tag modifications
-        updated_tags = None
-        if add_tags is not None or remove_tag_list is not None:
-            task = TASK_REPO.get_task(real_id)
-            current_tags = task["tags"] if task["tags"] is not None else []
-            updated_tags = list(current_tags)
+    real_ids = list(ID_MAP_REPO.get_real_ids("tasks", ids).values())
+    current_tasks = TASK_REPO.get_tasks(real_ids)
 
-            if add_tags is not None:
-                updated_tags.extend(add_tags)
-
-            if remove_tag_list is not None:
-                updated_tags = [
-                    tag for tag in updated_tags if tag not in remove_tag_list
-                ]
+    # Values that are the same for every task are converted once
+    real_cloned_from_id: Optional[EntityId] = (
+        ID_MAP_REPO.get_real_id("tasks", cloned_from_id)
+        if cloned_from_id is not None
+        else None
+    )
+    real_timespan_id: Optional[EntityId] = (
+        ID_MAP_REPO.get_real_id("timespans", timespan_id)
+        if timespan_id is not None
+        else None
+    )
+    parsed_estimate = duration_from_str_optional(estimate)
 
-            # Set to None if empty, otherwise keep the list
-            updated_tags = updated_tags if len(updated_tags) > 0 else None
+    modify_tag_list = add_tags is not None or remove_tag_list is not None
+    add_tag_list = add_tags or []
+    remove_tag_set = frozenset(remove_tag_list or ())
+    modify_project_list = add_projects is not None or remove_project_list is not None
+    add_project_list = add_projects or []
+    remove_project_set = frozenset(remove_project_list or ())
 
-        # Handle project modifications
+    # Process each task
+    modified_tasks = []
+    for real_id, task in zip(real_ids, current_tasks):
+        # Handle tag modifications, set to None if nothing is left
+        updated_tags = None
+        if modify_tag_list:
+            updated_tags = [
+                tag
+                for tag in [*(task["tags"] or ()), *add_tag_list]
+                if tag not in remove_tag_set
+            ] or None
+
+        # Handle project modifications, set to None if nothing is left
         updated_projects = None
-        if add_projects is not None or remove_project_list is not None:
-            task = TASK_REPO.get_task(real_id)
-            current_projects = task["projects"] if task["projects"] is not None else []
-            updated_projects = list(current_projects)
-
-            if add_projects is not None:
-                updated_projects.extend(add_projects)
-
-            if remove_project_list is not None:
-                updated_projects = [
-                    p for p in updated_projects if p not in remove_project_list
-                ]
-
-            # Set to None if empty, otherwise keep the list
-            updated_projects = updated_projects if len(updated_projects) > 0 else None
-
-        real_cloned_from_id: Optional[EntityId] = (
-            ID_MAP_REPO.get_real_id("tasks", cloned_from_id)
-            if cloned_from_id is not None
-            else None
-        )
-        real_timespan_id: Optional[EntityId] = (
-            ID_MAP_REPO.get_real_id("timespans", timespan_id)
-            if timespan_id is not None
-            else None
-        )
-
-        TASK_REPO.modify_task(
+        if modify_project_list:
+            updated_projects = [
+                p
+                for p in [*(task["projects"] or ()), *add_project_list]
+                if p not in remove_project_set
+            ] or None
+
+        task = TASK_REPO.modify_task(
             real_id,
             real_cloned_from_id,
             real_timespan_id,
@@ -397,7 +331,7 @@ def modify(
             updated_tags,
             priority,
             color,
-            duration_from_str_optional(estimate),
+            parsed_estimate,
             scheduled,
             due,
             started,
@@ -421,20 +355,17 @@ def modify(
             remove_cancelled,
             remove_deleted,
         )
-
-        task = TASK_REPO.get_task(real_id)
         modified_tasks.append(task)
 
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
+    time_audits = TIME_AUDIT_REPO.get_time_audits_for_tasks(real_ids)
 
     if config["use_git_versioning"]:
         task_descriptions = [f"{t['id']}: {t['description']}" for t in modified_tasks]
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"modify task(s): {', '.join(task_descriptions)}"
         )
 
-    for task in modified_tasks:
-        task_report.single_task_view(active_context_name, task, time_audits)
+    task_report.multi_task_view(active_context_name, modified_tasks, time_audits)
 
     if config["cache_view"]:
         show_cached_dispatch()
@@ -442,277 +373,49 @@ def modify(
 
 @app.command("complete, c", no_args_is_help=True)
 def complete(id: str) -> None:
-    config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
-
-    # Parse ID list
-    ids: list[int] = parse_id_list(id)
-
-    # Process each task
-    completed_tasks = []
-    for task_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
-
-        TASK_REPO.modify_task(
-            real_id,
-            None,  # cloned_from_id
-            None,  # timespan_id
-            None,  # description
-            None,  # projects
-            None,  # tags
-            None,  # priority
-            None,  # color
-            None,  # estimate
-            None,  # scheduled
-            None,  # due
-            None,  # started
-            now_utc(),  # completed
-            None,  # not_completed
-            None,  # cancelled
-            None,  # deleted
-            False,  # remove_cloned_from_id
-            False,  # remove_timespan_id
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_priority
-            False,  # remove_color
-            False,  # remove_estimate
-            False,  # remove_scheduled
-            False,  # remove_due
-            False,  # remove_started
-            False,  # remove_completed
-            False,  # remove_not_completed
-            False,  # remove_cancelled
-            False,  # remove_deleted
-        )
-
-        task = TASK_REPO.get_task(real_id)
-        completed_tasks.append(task)
-
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    if config["use_git_versioning"]:
-        task_descriptions = [f"{t['id']}: {t['description']}" for t in completed_tasks]
-        version.create_data_checkpoint(
-            f"complete task(s): {', '.join(task_descriptions)}"
-        )
-
-    for task in completed_tasks:
-        task_report.single_task_view(active_context_name, task, time_audits)
-
-    if config["cache_view"]:
-        show_cached_dispatch()
+    _status_command(id, "completed", "complete")
 
 
 @app.command("not-complete, nc", no_args_is_help=True)
 def not_complete(id: str) -> None:
-    config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
-
-    # Parse ID list
-    ids: list[int] = parse_id_list(id)
-
-    # Process each task
-    not_completed_tasks = []
-    for task_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
-
-        TASK_REPO.modify_task(
-            real_id,
-            None,  # cloned_from_id
-            None,  # timespan_id
-            None,  # description
-            None,  # projects
-            None,  # tags
-            None,  # priority
-            None,  # color
-            None,  # estimate
-            None,  # scheduled
-            None,  # due
-            None,  # started
-            None,  # completed
-            now_utc(),  # not_completed
-            None,  # cancelled
-            None,  # deleted
-            False,  # remove_cloned_from_id
-            False,  # remove_timespan_id
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_priority
-            False,  # remove_color
-            False,  # remove_estimate
-            False,  # remove_scheduled
-            False,  # remove_due
-            False,  # remove_started
-            False,  # remove_completed
-            False,  # remove_not_completed
-            False,  # remove_cancelled
-            False,  # remove_deleted
-        )
-
-        task = TASK_REPO.get_task(real_id)
-        not_completed_tasks.append(task)
-
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    if config["use_git_versioning"]:
-        task_descriptions = [
-            f"{t['id']}: {t['description']}" for t in not_completed_tasks
-        ]
-        version.create_data_checkpoint(
-            f"not-complete task(s): {', '.join(task_descriptions)}"
-        )
-
-    for task in not_completed_tasks:
-        task_report.single_task_view(active_context_name, task, time_audits)
-
-    if config["cache_view"]:
-        show_cached_dispatch()
+    _status_command(id, "not_completed", "not-complete")
 
 
 @app.command("cancel, ca", no_args_is_help=True)
 def cancel(id: str) -> None:
-    config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
-
-    # Parse ID list
-    ids: list[int] = parse_id_list(id)
-
-    # Process each task
-    cancelled_tasks = []
-    for task_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
-
-        TASK_REPO.modify_task(
-            real_id,
-            None,  # cloned_from_id
-            None,  # timespan_id
-            None,  # description
-            None,  # projects
-            None,  # tags
-            None,  # priority
-            None,  # color
-            None,  # estimate
-            None,  # scheduled
-            None,  # due
-            None,  # started
-            None,  # completed
-            None,  # not_completed
-            now_utc(),  # cancelled
-            None,  # deleted
-            False,  # remove_cloned_from_id
-            False,  # remove_timespan_id
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_priority
-            False,  # remove_color
-            False,  # remove_estimate
-            False,  # remove_scheduled
-            False,  # remove_due
-            False,  # remove_started
-            False,  # remove_completed
-            False,  # remove_not_completed
-            False,  # remove_cancelled
-            False,  # remove_deleted
-        )
-
-        task = TASK_REPO.get_task(real_id)
-        cancelled_tasks.append(task)
-
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    if config["use_git_versioning"]:
-        task_descriptions = [f"{t['id']}: {t['description']}" for t in cancelled_tasks]
-        version.create_data_checkpoint(
-            f"cancel task(s): {', '.join(task_descriptions)}"
-        )
-
-    for task in cancelled_tasks:
-        task_report.single_task_view(active_context_name, task, time_audits)
-
-    if config["cache_view"]:
-        show_cached_dispatch()
+    _status_command(id, "cancelled", "cancel")
 
 
 @app.command("delete, d", no_args_is_help=True)
 def delete(id: str) -> None:
-    config = CONFIGURATION_REPO.get_config()
-    version = Version()
+    _status_command(id, "deleted", "delete")
 
-    active_context = CONTEXT_REPO.get_active_context()
 
-    active_context_name = cast(str, active_context["name"])
+def _status_command(id: str, status_field: TaskStatusField, verb: str) -> None:
+    """Stamp status_field with the current time on every task in the id list."""
+    config = CONFIGURATION_REPO.get_config()
+    active_context_name = CONTEXT_REPO.require_active_context_name()
 
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Process each task
-    deleted_tasks = []
-    for task_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
-
-        TASK_REPO.modify_task(
-            real_id,
-            None,  # cloned_from_id
-            None,  # timespan_id
-            None,  # description
-            None,  # projects
-            None,  # tags
-            None,  # priority
-            None,  # color
-            None,  # estimate
-            None,  # scheduled
-            None,  # due
-            None,  # started
-            None,  # completed
-            None,  # not_completed
-            None,  # cancelled
-            now_utc(),  # deleted
-            False,  # remove_cloned_from_id
-            False,  # remove_timespan_id
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_priority
-            False,  # remove_color
-            False,  # remove_estimate
-            False,  # remove_scheduled
-            False,  # remove_due
-            False,  # remove_started
-            False,  # remove_completed
-            False,  # remove_not_completed
-            False,  # remove_cancelled
-            False,  # remove_deleted
-        )
+    real_ids = list(ID_MAP_REPO.get_real_ids("tasks", ids).values())
 
-        task = TASK_REPO.get_task(real_id)
-        deleted_tasks.append(task)
+    # Every task in one command gets the same status timestamp
+    timestamp = now_utc()
+    changed_tasks = [
+        TASK_REPO.set_status(real_id, status_field, timestamp) for real_id in real_ids
+    ]
 
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
+    time_audits = TIME_AUDIT_REPO.get_time_audits_for_tasks(real_ids)
 
     if config["use_git_versioning"]:
-        task_descriptions = [f"{t['id']}: {t['description']}" for t in deleted_tasks]
-        version.create_data_checkpoint(
-            f"delete task(s): {', '.join(task_descriptions)}"
+        task_descriptions = [f"{t['id']}: {t['description']}" for t in changed_tasks]
+        Version().create_data_checkpoint(
+            f"{verb} task(s): {', '.join(task_descriptions)}"
         )
 
-    for task in deleted_tasks:
-        task_report.single_task_view(active_context_name, task, time_audits)
+    task_report.multi_task_view(active_context_name, changed_tasks, time_audits)
 
     if config["cache_view"]:
         show_cached_dispatch()
@@ -721,30 +424,18 @@ def delete(id: str) -> None:
 @app.command("clone, cl", no_args_is_help=True)
 def clone(
     id: int,
-    scheduled: Annotated[
-        Optional[pendulum.DateTime],
-        typer.Option(
-            "--scheduled",
-            "-s",
-            parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
-        ),
-    ] = None,
+    scheduled: Annotated[Optional[pendulum.DateTime], _SCHEDULED_OPTION] = None,
     due: Annotated[
         Optional[pendulum.DateTime],
         typer.Option(
             "--due",
             "-d",
             parser=parse_datetime,
-            help="valid inputs: YYYY-MM-DD, today, yesterday, tomorrow, or day offset like 1, -1",
+            help=_DATETIME_HELP,
         ),
     ] = None,
 ) -> None:
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
+    active_context_name = CONTEXT_REPO.require_active_context_name()
     real_id = ID_MAP_REPO.get_real_id("tasks", id)
     config = CONFIGURATION_REPO.get_config()
 
@@ -770,15 +461,12 @@ def clone(
     new_id = TASK_REPO.save_new_task(cloned_task)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"clone task: {real_id} -> {new_id}: {cloned_task['description']}"
         )
 
     new_task = TASK_REPO.get_task(new_id)
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    if active_context_name is None:
-        raise ValueError("context name cannot be None")
+    time_audits = TIME_AUDIT_REPO.get_time_audits_for_tasks([new_id])
 
     task_report.single_task_view(active_context_name, new_task, time_audits)
 
@@ -791,47 +479,23 @@ def track(
     id: str,
     description: Annotated[Optional[str], typer.Option("--description", "-d")] = None,
 ) -> None:
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
-    active_context_name = cast(str, active_context["name"])
+    active_context_name = CONTEXT_REPO.require_active_context_name()
     config = CONFIGURATION_REPO.get_config()
 
     # Parse comma-separated task IDs
     task_ids_parsed: list[int] = parse_id_list(id)
-    real_ids: list[EntityId] = [
-        ID_MAP_REPO.get_real_id("tasks", tid) for tid in task_ids_parsed
-    ]
+    real_ids: list[EntityId] = list(
+        ID_MAP_REPO.get_real_ids("tasks", task_ids_parsed).values()
+    )
 
     # Look up all tasks and validate they exist
-    tasks = [TASK_REPO.get_task(rid) for rid in real_ids]
+    tasks = TASK_REPO.get_tasks(real_ids)
 
     # Stop any currently open time audits
-    all_time_audits = TIME_AUDIT_REPO.get_all_time_audits()
     current_time = now_utc()
-    for existing_time_audit in all_time_audits:
-        if (
-            existing_time_audit["end"] is None
-            and existing_time_audit["deleted"] is None
-        ):
-            TIME_AUDIT_REPO.modify_time_audit(
-                existing_time_audit["id"],  # type: ignore[arg-type]
-                None,
-                None,
-                None,
-                None,
-                None,
-                current_time,
-                None,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-            )
+    TIME_AUDIT_REPO.close_open_time_audits(current_time)
 
     # Merge description from all tasks (or use --description flag)
     if description is not None:
@@ -841,43 +505,31 @@ def track(
             task["description"] for task in tasks if task["description"] is not None
         )
 
-    # Merge projects from all tasks (deduplicated)
-    merged_projects: Optional[list[str]] = None
-    for task in tasks:
-        if task["projects"] is not None:
-            if merged_projects is None:
-                merged_projects = []
-            for p in task["projects"]:
-                if p not in merged_projects:
-                    merged_projects.append(p)
-
-    # Merge with context auto_added_projects
-    if active_context["auto_added_projects"] is not None:
-        if merged_projects is None:
-            merged_projects = active_context["auto_added_projects"]
-        else:
-            for proj in active_context["auto_added_projects"]:
-                if proj not in merged_projects:
-                    merged_projects.append(proj)
-
-    # Merge tags from all tasks (deduplicated)
-    merged_tags: Optional[list[str]] = None
-    for task in tasks:
-        if task["tags"] is not None:
-            if merged_tags is None:
-                merged_tags = []
-            for t in task["tags"]:
-                if t not in merged_tags:
-                    merged_tags.append(t)
-
-    # Merge with context auto_added_tags
-    if active_context["auto_added_tags"] is not None:
-        if merged_tags is None:
-            merged_tags = active_context["auto_added_tags"]
-        else:
-            for tag in active_context["auto_added_tags"]:
-                if tag not in merged_tags:
-                    merged_tags.append(tag)
+    # Merge projects from all tasks and the context (deduplicated, in order)
+    merged_projects: Optional[list[str]] = (
+        list(
+            dict.fromkeys(
+                chain(
+                    chain.from_iterable(task["projects"] or () for task in tasks),
+                    active_context["auto_added_projects"] or (),
+                )
+            )
+        )
+        or None
+    )
+
+    # Merge tags from all tasks and the context (deduplicated, in order)
+    merged_tags: Optional[list[str]] = (
+        list(
+            dict.fromkeys(
+                chain(
+                    chain.from_iterable(task["tags"] or () for task in tasks),
+                    active_context["auto_added_tags"] or (),
+                )
+            )
+        )
+        or None
+    )
 
     # Color: random if config enabled, otherwise None (don't take from tasks)
     time_audit_color = None
@@ -898,16 +550,25 @@ def track(
     new_time_audit = TIME_AUDIT_REPO.get_time_audit(time_audit_id)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"track task: {','.join(str(rid) for rid in real_ids)}: {new_time_audit['description']}"
         )
 
-    if active_context_name is None:
-        raise ValueError("context name cannot be None")
-
     time_audit_report.single_time_audit_report(active_context_name, new_time_audit)
 
 
+def _load_task_command(
+    real_id: EntityId,
+) -> tuple[Context, str, Configuration, Task]:
+    """Load the context, its name, the config and the task for task log/note."""
+    return (
+        CONTEXT_REPO.get_active_context(),
+        CONTEXT_REPO.require_active_context_name(),
+        CONFIGURATION_REPO.get_config(),
+        TASK_REPO.get_task(real_id),
+    )
+
+
 @app.command("log, lg", no_args_is_help=True)
 def log(
     task_id: int,
@@ -933,16 +594,8 @@ def log(
     """
     Add a log entry for a task using an editor.
     """
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
+    # Resolve the id first so a mistyped id fails before any text is written
     real_id = ID_MAP_REPO.get_real_id("tasks", task_id)
-    config = CONFIGURATION_REPO.get_config()
-
-    # Get the task
-    task = TASK_REPO.get_task(real_id)
 
     # Open editor to get log text
     text = open_editor_for_text()
@@ -950,6 +603,8 @@ def log(
     if not text:
         raise typer.Exit(0)
 
+    active_context, active_context_name, config, task = _load_task_command(real_id)
+
     log_entry = create_log_for_entity(
         text=text,
         reference_type=EntityType.TASK,
@@ -959,17 +614,14 @@ def log(
         timestamp=timestamp,
         add_tags=add_tags,
         color=None,
+        config=config,
+        active_context=active_context,
     )
 
-    log_id = LOG_REPO.save_new_log(log_entry)
+    new_log = LOG_REPO.save_new_log(log_entry)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add log for task {real_id}: {log_id}")
-
-    new_log = LOG_REPO.get_log(log_id)
-
-    if active_context_name is None:
-        raise ValueError("context name cannot be None")
+        Version().create_data_checkpoint(f"add log for task {real_id}: {new_log['id']}")
 
     log_report.single_log_report(active_context_name, new_log)
 
@@ -1009,16 +661,8 @@ def note(
     """
     Add a note for a task
     """
-    version = Version()
-
-    active_context = CONTEXT_REPO.get_active_context()
-
-    active_context_name = cast(str, active_context["name"])
+    # Resolve the id first so a mistyped id fails before any text is written
     real_id = ID_MAP_REPO.get_real_id("tasks", task_id)
-    config = CONFIGURATION_REPO.get_config()
-
-    # Get the task
-    task = TASK_REPO.get_task(real_id)
 
     # Open editor for note text
     text = open_editor_for_text()
@@ -1026,24 +670,21 @@ def note(
         typer.echo("Note creation cancelled (no text provided)")
         return
 
-    # Start with task tags
-    note_tags = task["tags"] if task["tags"] is not None else []
-    note_tags = list(note_tags)  # Make a copy
-
-    # Add context tags if they're not already in the task tags
-    if active_context["auto_added_tags"] is not None:
-        for tag in active_context["auto_added_tags"]:
-            if tag not in note_tags:
-                note_tags.append(tag)
-
-    # Add any additional tags from the command
-    if add_tags is not None:
-        for tag in add_tags:
-            if tag not in note_tags:
-                note_tags.append(tag)
-
-    # Set to None if empty
-    final_tags = note_tags if len(note_tags) > 0 else None
+    active_context, active_context_name, config, task = _load_task_command(real_id)
+
+    # Task tags, then context tags, then command tags (deduplicated, in order)
+    final_tags: Optional[list[str]] = (
+        list(
+            dict.fromkeys(
+                chain(
+                    task["tags"] or (),
+                    active_context["auto_added_tags"] or (),
+                    add_tags or (),
+                )
+            )
+        )
+        or None
+    )
 
     # Create the note
     note_entry = get_note_template()
@@ -1079,80 +720,53 @@ def note(
         # Prompt for filename
         external_filename = typer.prompt("Enter filename (without extension)")
 
-    note_id = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
+    new_note = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add note for task {real_id}: {note_id}")
-
-    new_note = NOTE_REPO.get_note(note_id)
-
-    if active_context_name is None:
-        raise ValueError("context name cannot be None")
+        Version().create_data_checkpoint(
+            f"add note for task {real_id}: {new_note['id']}"
+        )
 
     note_report.single_note_report(active_context_name, new_note)
 
 
 @app.command("color, co")
-def color() -> None:
+def color(
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run", help="Report how many tasks have null colors, change nothing"
+        ),
+    ] = False,
+) -> None:
     """Add random colors to all tasks with null colors."""
     from rich.console import Console
 
-    version = Version()
-
     config = CONFIGURATION_REPO.get_config()
     console = Console()
 
-    # Get all tasks
-    all_tasks = TASK_REPO.get_all_tasks()
+    ids_without_color = TASK_REPO.get_task_ids_missing_color()
 
-    # Filter tasks with null color
-    tasks_without_color = [task for task in all_tasks if task["color"] is None]
-
-    if len(tasks_without_color) == 0:
+    if len(ids_without_color) == 0:
         console.print("[yellow]No tasks with null colors found.[/yellow]")
         return
 
-    # Add random colors to tasks without color
-    for task in tasks_without_color:
-        TASK_REPO.modify_task(
-            task["id"],  # type: ignore[arg-type]
-            None,  # cloned_from_id
-            None,  # timespan_id
-            None,  # description
-            None,  # projects
-            None,  # tags
-            None,  # priority
-            get_random_color(),  # color
-            None,  # estimate
-            None,  # scheduled
-            None,  # due
-            None,  # started
-            None,  # completed
-            None,  # not_completed
-            None,  # cancelled
-            None,  # deleted
-            False,  # remove_cloned_from_id
-            False,  # remove_timespan_id
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_priority
-            False,  # remove_color
-            False,  # remove_estimate
-            False,  # remove_scheduled
-            False,  # remove_due
-            False,  # remove_started
-            False,  # remove_completed
-            False,  # remove_not_completed
-            False,  # remove_cancelled
-            False,  # remove_deleted
+    if dry_run:
+        console.print(
+            f"[yellow]{len(ids_without_color)} task(s) with null colors found.[/yellow]"
         )
+        return
+
+    # Add random colors to tasks without color
+    TASK_REPO.bulk_set_colors(
+        dict(zip(ids_without_color, get_random_colors(len(ids_without_color))))
+    )
 
     console.print(
-        f"[green]Added random colors to {len(tasks_without_color)} task(s).[/green]"
+        f"[green]Added random colors to {len(ids_without_color)} task(s).[/green]"
     )
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
-            f"add random colors to {len(tasks_without_color)} task(s)"
+        Version().create_data_checkpoint(
+            f"add random colors to {len(ids_without_color)} task(s)"
         )
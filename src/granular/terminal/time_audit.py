@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: MIT
 
+from itertools import chain
 from typing import Annotated, Optional
 
 import pendulum
 import typer
 
-from granular.color import get_random_color
+from granular.color import get_random_color, get_random_colors
 from granular.model.entity_id import EntityId
 from granular.model.entity_type import EntityType
 from granular.repository.configuration import (
@@ -81,8 +82,6 @@ def add(
     """
     add a time audit
     """
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     config = CONFIGURATION_REPO.get_config()
 
@@ -90,7 +89,7 @@ def add(
     real_task_ids: Optional[list[EntityId]] = None
     if task_id is not None:
         parsed_ids = parse_id_list(task_id)
-        real_task_ids = [ID_MAP_REPO.get_real_id("tasks", tid) for tid in parsed_ids]
+        real_task_ids = list(ID_MAP_REPO.get_real_ids("tasks", parsed_ids).values())
 
     time_audit_tags = active_context["auto_added_tags"]
     if tags is not None:
@@ -124,35 +123,13 @@ def add(
     time_audit["task_ids"] = real_task_ids
 
     # Close any open time audits by setting their end time to the new start time
-    all_time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-    for existing_time_audit in all_time_audits:
-        if (
-            existing_time_audit["end"] is None
-            and existing_time_audit["deleted"] is None
-        ):
-            TIME_AUDIT_REPO.modify_time_audit(
-                existing_time_audit["id"],  # type: ignore[arg-type]
-                None,
-                None,
-                None,
-                None,
-                None,
-                time_audit["start"],
-                None,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-                False,
-            )
+    TIME_AUDIT_REPO.close_open_time_audits(time_audit["start"])  # type: ignore[arg-type]
 
     id = TIME_AUDIT_REPO.save_new_time_audit(time_audit)
     new_time_audit = TIME_AUDIT_REPO.get_time_audit(id)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"add time audit: {id}: {new_time_audit['description']}"
         )
 
@@ -256,8 +233,6 @@ def modify(
     modify a time audit
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     # Parse ID list
@@ -267,62 +242,51 @@ def modify(
     real_add_task_ids: Optional[list[EntityId]] = None
     if add_task_id is not None:
         parsed_add = parse_id_list(add_task_id)
-        real_add_task_ids = [
-            ID_MAP_REPO.get_real_id("tasks", tid) for tid in parsed_add
-        ]
+        real_add_task_ids = list(ID_MAP_REPO.get_real_ids("tasks", parsed_add).values())
 
     # Parse remove_task_id comma-separated string
     real_remove_task_ids: Optional[list[EntityId]] = None
     if remove_task_id is not None:
         parsed_remove = parse_id_list(remove_task_id)
-        real_remove_task_ids = [
-            ID_MAP_REPO.get_real_id("tasks", tid) for tid in parsed_remove
-        ]
+        real_remove_task_ids = list(
+            ID_MAP_REPO.get_real_ids("tasks", parsed_remove).values()
+        )
+
+    # Resolve every id and load the time audits once, before changing anything
+    real_ids: list[EntityId] = list(
+        ID_MAP_REPO.get_real_ids("time_audits", ids).values()
+    )
+    time_audits = TIME_AUDIT_REPO.get_time_audits(real_ids)
+
+    modify_tag_list = add_tags is not None or remove_tag_list is not None
+    add_tag_list = add_tags or []
+    remove_tag_set = frozenset(remove_tag_list or ())
+    modify_project_list = add_projects is not None or remove_project_list is not None
+    add_project_list = add_projects or []
+    remove_project_set = frozenset(remove_project_list or ())
 
     # Process each time audit
     modified_time_audits = []
-    for time_audit_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("time_audits", time_audit_id)
-
-        # Handle tag modifications
+    for real_id, time_audit in zip(real_ids, time_audits):
+        # Handle tag modifications, set to None if nothing is left
         updated_tags = None
-        if add_tags is not None or remove_tag_list is not None:
-            time_audit = TIME_AUDIT_REPO.get_time_audit(real_id)
-            current_tags = time_audit["tags"] if time_audit["tags"] is not None else []
-            updated_tags = list(current_tags)
-
-            if add_tags is not None:
-                updated_tags.extend(add_tags)
-
-            if remove_tag_list is not None:
-                updated_tags = [
-                    tag for tag in updated_tags if tag not in remove_tag_list
-                ]
-
-            # Set to None if empty, otherwise keep the list
-            updated_tags = updated_tags if len(updated_tags) > 0 else None
-
-        # Handle project modifications
+        if modify_tag_list:
+            updated_tags = [
+                tag
+                for tag in [*(time_audit["tags"] or ()), *add_tag_list]
+                if tag not in remove_tag_set
+            ] or None
+
+        # Handle project modifications, set to None if nothing is left
         updated_projects = None
-        if add_projects is not None or remove_project_list is not None:
-            time_audit = TIME_AUDIT_REPO.get_time_audit(real_id)
-            current_projects = (
-                time_audit["projects"] if time_audit["projects"] is not None else []
-            )
-            updated_projects = list(current_projects)
-
-            if add_projects is not None:
-                updated_projects.extend(add_projects)
-
-            if remove_project_list is not None:
-                updated_projects = [
-                    p for p in updated_projects if p not in remove_project_list
-                ]
-
-            # Set to None if empty, otherwise keep the list
-            updated_projects = updated_projects if len(updated_projects) > 0 else None
-
-        TIME_AUDIT_REPO.modify_time_audit(
+        if modify_project_list:
+            updated_projects = [
+                p
+                for p in [*(time_audit["projects"] or ()), *add_project_list]
+                if p not in remove_project_set
+            ] or None
+
+        time_audit = TIME_AUDIT_REPO.modify_time_audit(
             real_id,
             description,
             updated_projects,
@@ -342,15 +306,13 @@ def modify(
             remove_task_ids=real_remove_task_ids,
             remove_all_task_ids=remove_task_ids,
         )
-
-        time_audit = TIME_AUDIT_REPO.get_time_audit(real_id)
         modified_time_audits.append(time_audit)
 
     if config["use_git_versioning"]:
-        time_audit_descriptions = [
+        time_audit_descriptions = (
             f"{ta['id']}: {ta['description']}" for ta in modified_time_audits
-        ]
-        version.create_data_checkpoint(
+        )
+        Version().create_data_checkpoint(
             f"modify time audit(s): {', '.join(time_audit_descriptions)}"
         )
 
@@ -368,44 +330,27 @@ def delete(id: str) -> None:
     delete a time audit
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     # Parse ID list
     ids: list[int] = parse_id_list(id)
 
-    # Process each time audit
-    deleted_time_audits = []
-    for time_audit_id in ids:
-        real_id: EntityId = ID_MAP_REPO.get_real_id("time_audits", time_audit_id)
-
-        TIME_AUDIT_REPO.modify_time_audit(
-            real_id,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            now_utc(),
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-        )
+    # Resolve every id before deleting anything
+    real_ids: list[EntityId] = list(
+        ID_MAP_REPO.get_real_ids("time_audits", ids).values()
+    )
 
-        time_audit = TIME_AUDIT_REPO.get_time_audit(real_id)
-        deleted_time_audits.append(time_audit)
+    # Process each time audit
+    deleted_time_audits = [
+        TIME_AUDIT_REPO.modify_time_audit(real_id, deleted=now_utc())
+        for real_id in real_ids
+    ]
 
     if config["use_git_versioning"]:
-        time_audit_descriptions = [
+        time_audit_descriptions = (
             f"{ta['id']}: {ta['description']}" for ta in deleted_time_audits
-        ]
-        version.create_data_checkpoint(
+        )
+        Version().create_data_checkpoint(
             f"delete time audit(s): {', '.join(time_audit_descriptions)}"
         )
 
@@ -423,17 +368,10 @@ def stop() -> None:
     if there is an active time audit, stop it
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
 
     # Find all open time audits
-    all_time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-    open_time_audits = [
-        time_audit
-        for time_audit in all_time_audits
-        if time_audit["end"] is None and time_audit["deleted"] is None
-    ]
+    open_time_audits = TIME_AUDIT_REPO.get_open_time_audits()
 
     # Check that at most one time audit is open
     if len(open_time_audits) > 1:
@@ -448,29 +386,13 @@ def stop() -> None:
 
     # Close the open time audit
     open_time_audit = open_time_audits[0]
-    TIME_AUDIT_REPO.modify_time_audit(
+    closed_time_audit = TIME_AUDIT_REPO.modify_time_audit(
         open_time_audit["id"],  # type: ignore[arg-type]
-        None,
-        None,
-        None,
-        None,
-        None,
-        now_utc(),
-        None,
-        False,
-        False,
-        False,
-        False,
-        False,
-        False,
-        False,
+        end=now_utc(),
     )
 
-    # Get the updated time audit and display it
-    closed_time_audit = TIME_AUDIT_REPO.get_time_audit(open_time_audit["id"])  # type: ignore[arg-type]
-
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"close time audit: {closed_time_audit['id']}: {closed_time_audit['description']}"
         )
 
@@ -500,8 +422,6 @@ def move_adjacent_start(
     move the start time of a time audit and adjust the end time of the previous adjacent audit
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     real_id = ID_MAP_REPO.get_real_id("time_audits", id)
 
@@ -511,7 +431,7 @@ def move_adjacent_start(
     )
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"move adjacent start for time audit: {modified_target['id']}: {modified_target['description']}"
         )
 
@@ -552,8 +472,6 @@ def move_adjacent_end(
     move the end time of a time audit and adjust the start time of the next adjacent audit
     """
     config = CONFIGURATION_REPO.get_config()
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     real_id = ID_MAP_REPO.get_real_id("time_audits", id)
 
@@ -561,7 +479,7 @@ def move_adjacent_end(
     modified_target, modified_next = TIME_AUDIT_REPO.move_adjacent_end(real_id, end)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
+        Version().create_data_checkpoint(
             f"move adjacent end for time audit: {modified_target['id']}: {modified_target['description']}"
         )
 
@@ -610,8 +528,6 @@ def log(
     """
     Add a log entry for a time audit using an editor.
     """
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     real_id = ID_MAP_REPO.get_real_id("time_audits", time_audit_id)
     config = CONFIGURATION_REPO.get_config()
@@ -637,14 +553,16 @@ def log(
         timestamp=timestamp,
         add_tags=add_tags,
         color=None,
+        config=config,
+        active_context=active_context,
     )
 
-    log_id = LOG_REPO.save_new_log(log_entry)
+    new_log = LOG_REPO.save_new_log(log_entry)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add log for time audit {real_id}: {log_id}")
-
-    new_log = LOG_REPO.get_log(log_id)
+        Version().create_data_checkpoint(
+            f"add log for time audit {real_id}: {new_log['id']}"
+        )
 
     log_report.single_log_report(active_context["name"], new_log)
 
@@ -687,8 +605,6 @@ def note(
     """
     Add a note for a time audit
     """
-    version = Version()
-
     active_context = CONTEXT_REPO.get_active_context()
     real_id = ID_MAP_REPO.get_real_id("time_audits", time_audit_id)
     config = CONFIGURATION_REPO.get_config()
@@ -702,24 +618,19 @@ def note(
         typer.echo("Note creation cancelled (no text provided)")
         return
 
-    # Start with time audit tags
-    note_tags = time_audit["tags"] if time_audit["tags"] is not None else []
-    note_tags = list(note_tags)  # Make a copy
-
-    # Add context tags if they're not already in the time audit tags
-    if active_context["auto_added_tags"] is not None:
-        for tag in active_context["auto_added_tags"]:
-            if tag not in note_tags:
-                note_tags.append(tag)
-
-    # Add any additional tags from the command
-    if add_tags is not None:
-        for tag in add_tags:
-            if tag not in note_tags:
-                note_tags.append(tag)
-
-    # Set to None if empty
-    final_tags = note_tags if len(note_tags) > 0 else None
+    # Time audit tags, then context tags, then command tags (deduplicated, in order)
+    final_tags: Optional[list[str]] = (
+        list(
+            dict.fromkeys(
+                chain(
+                    time_audit["tags"] or (),
+                    active_context["auto_added_tags"] or (),
+                    add_tags or (),
+                )
+            )
+        )
+        or None
+    )
 
     # Create the note
     note_entry = get_note_template()
@@ -755,12 +666,12 @@ def note(
         # Prompt for filename
         external_filename = typer.prompt("Enter filename (without extension)")
 
-    note_id = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
+    new_note = NOTE_REPO.save_new_note(note_entry, external_filename, note_folder_name)
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(f"add note for time audit {real_id}: {note_id}")
-
-    new_note = NOTE_REPO.get_note(note_id)
+        Version().create_data_checkpoint(
+            f"add note for time audit {real_id}: {new_note['id']}"
+        )
 
     if active_context["name"] is None:
         raise ValueError("context name cannot be None")
@@ -776,50 +687,27 @@ def color() -> None:
     """Add random colors to all time audits with null colors."""
     from rich.console import Console
 
-    version = Version()
-
     config = CONFIGURATION_REPO.get_config()
     console = Console()
 
-    # Get all time audits
-    all_time_audits = TIME_AUDIT_REPO.get_all_time_audits()
-
-    # Filter time audits with null color
-    time_audits_without_color = [
-        time_audit for time_audit in all_time_audits if time_audit["color"] is None
-    ]
+    ids_without_color = TIME_AUDIT_REPO.get_time_audit_ids_missing_color()
 
-    if len(time_audits_without_color) == 0:
+    if len(ids_without_color) == 0:
         console.print("[yellow]No time audits with null colors found.[/yellow]")
         return
 
     # Add random colors to time audits without color
-    for time_audit in time_audits_without_color:
-        TIME_AUDIT_REPO.modify_time_audit(
-            time_audit["id"],  # type: ignore[arg-type]
-            None,  # description
-            None,  # projects
-            None,  # tags
-            get_random_color(),  # color
-            None,  # start
-            None,  # end
-            None,  # deleted
-            False,  # remove_description
-            False,  # remove_projects
-            False,  # remove_tags
-            False,  # remove_color
-            False,  # remove_start
-            False,  # remove_end
-            False,  # remove_deleted
-        )
+    TIME_AUDIT_REPO.bulk_set_colors(
+        dict(zip(ids_without_color, get_random_colors(len(ids_without_color))))
+    )
 
     console.print(
-        f"[green]Added random colors to {len(time_audits_without_color)} time audit(s).[/green]"
+        f"[green]Added random colors to {len(ids_without_color)} time audit(s).[/green]"
     )
 
     if config["use_git_versioning"]:
-        version.create_data_checkpoint(
-            f"add random colors to {len(time_audits_without_color)} time audit(s)"
+        Version().create_data_checkpoint(
+            f"add random colors to {len(ids_without_color)} time audit(s)"
         )
 
     if config["cache_view"]:
@@ -7,11 +7,13 @@ import typer
 
 from granular.repository.context import ContextRepository
 
+_DURATION_PATTERN = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+
 
 def validate_duration(duration: Optional[str]) -> Optional[str]:
     if duration is None:
         return None
-    if not re.match(r"^([01]?\d|2[0-3]):([0-5]\d)$", duration):
+    if not _DURATION_PATTERN.match(duration):
         raise typer.BadParameter("Incorrect duration format")
     return duration
 
@@ -142,7 +142,8 @@ def tasks(
         typer.Option("--no-wrap", help="Disable text wrapping in table columns"),
     ] = False,
 ) -> None:
-    tasks = TASK_REPO.get_all_tasks()
+    # Deleted tasks are filtered out by default, before they are copied
+    tasks = TASK_REPO.get_all_tasks(include_deleted=include_deleted)
     time_audits = TIME_AUDIT_REPO.get_all_time_audits()
     notes = NOTE_REPO.get_all_notes()
     logs = LOG_REPO.get_all_logs()
@@ -150,10 +151,6 @@ def tasks(
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted tasks by default
-    if not include_deleted:
-        tasks = [task for task in tasks if task["deleted"] is None]
-
     # Filter by scheduled date if provided
     if scheduled is not None:
         end_scheduled = scheduled.add(hours=23, minutes=59, seconds=59)
@@ -269,7 +266,7 @@ def task(
     real_task_id: EntityId = ID_MAP_REPO.get_real_id("tasks", task_id)
 
     task_obj = TASK_REPO.get_task(real_task_id)
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
+    time_audits = TIME_AUDIT_REPO.get_time_audits_for_tasks([real_task_id])
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
@@ -339,19 +336,14 @@ def time_audits(
 ) -> None:
     from granular.repository.id_map import ID_MAP_REPO
 
-    time_audits = TIME_AUDIT_REPO.get_all_time_audits()
+    # Deleted time audits are filtered out by default, before they are copied
+    time_audits = TIME_AUDIT_REPO.get_all_time_audits(include_deleted=include_deleted)
     notes = NOTE_REPO.get_all_notes()
     logs = LOG_REPO.get_all_logs()
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted time audits by default
-    if not include_deleted:
-        time_audits = [
-            time_audit for time_audit in time_audits if time_audit["deleted"] is None
-        ]
-
     # Parse task_id filter
     parsed_task_ids: Optional[list[int]] = None
     if task_id is not None:
@@ -562,17 +554,14 @@ def events(
         typer.Option("--no-wrap", help="Disable text wrapping in table columns"),
     ] = False,
 ) -> None:
-    events = EVENT_REPO.get_all_events()
+    # Deleted events are filtered out by default, before they are copied
+    events = EVENT_REPO.get_all_events(include_deleted=include_deleted)
     notes = NOTE_REPO.get_all_notes()
     logs = LOG_REPO.get_all_logs()
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted events by default
-    if not include_deleted:
-        events = [event for event in events if event["deleted"] is None]
-
     # Filter by tags if provided (exact match)
     if tag is not None:
         events = [
@@ -725,15 +714,12 @@ def timespans(
         typer.Option("--no-wrap", help="Disable text wrapping in table columns"),
     ] = False,
 ) -> None:
-    timespans = TIMESPAN_REPO.get_all_timespans()
+    # Deleted timespans are filtered out by default, before they are copied
+    timespans = TIMESPAN_REPO.get_all_timespans(include_deleted=include_deleted)
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted timespans by default
-    if not include_deleted:
-        timespans = [timespan for timespan in timespans if timespan["deleted"] is None]
-
     # Filter by tags if provided (exact match)
     if tag is not None:
         timespans = [
@@ -916,15 +902,12 @@ def logs(
     ] = False,
 ) -> None:
     """Display all logs in the system."""
-    logs_list = LOG_REPO.get_all_logs()
+    # Deleted logs are filtered out by default, before they are copied
+    logs_list = LOG_REPO.get_all_logs(include_deleted=include_deleted)
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted logs by default
-    if not include_deleted:
-        logs_list = [log for log in logs_list if log["deleted"] is None]
-
     # Filter by tags if provided (exact match)
     if tag is not None:
         logs_list = [
@@ -1068,15 +1051,12 @@ def notes(
     ] = False,
 ) -> None:
     """Display all notes in the system."""
-    notes_list = NOTE_REPO.get_all_notes()
+    # Deleted notes are filtered out by default, before they are copied
+    notes_list = NOTE_REPO.get_all_notes(include_deleted=include_deleted)
     active_context = CONTEXT_REPO.get_active_context()
 
     active_context_name = cast(str, active_context["name"])
 
-    # Filter out deleted notes by default
-    if not include_deleted:
-        notes_list = [note for note in notes_list if note["deleted"] is None]
-
     # Filter by tags if provided (exact match)
     if tag is not None:
         notes_list = [
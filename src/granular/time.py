@@ -1,18 +1,42 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+from functools import lru_cache
 from typing import Optional, cast
 
 import pendulum
 
+# Resolved once; passing the objects skips pendulum's per-call name lookup
+_UTC_TZ = pendulum.UTC
+_LOCAL_TZ = pendulum.local_timezone()
+
 
 def now_utc() -> pendulum.DateTime:
-    return pendulum.now("UTC")
+    return pendulum.now(_UTC_TZ)
+
+
+def start_of_today_utc() -> pendulum.DateTime:
+    return local_day_time_utc()
+
+
+@lru_cache(maxsize=1)
+def local_today() -> datetime.date:
+    # Resolved once per command so every relative date shares the same "today"
+    return datetime.date.today()
+
+
+def local_day_time_utc(
+    days_offset: int = 0, hour: int = 0, minute: int = 0
+) -> pendulum.DateTime:
+    # Compute the local wall-clock time with the stdlib; pendulum only wraps the result
+    local_date = local_today() + datetime.timedelta(days=days_offset)
+    local_value = datetime.datetime.combine(local_date, datetime.time(hour, minute))
+    return pendulum.from_timestamp(local_value.timestamp())
 
 
 def python_to_pendulum_utc(python_value: datetime.datetime) -> pendulum.DateTime:
-    pendulum_value = pendulum.instance(python_value, tz="local")
-    return pendulum_value.in_tz("UTC")
+    pendulum_value = pendulum.instance(python_value, tz=_LOCAL_TZ)
+    return pendulum_value.in_tz(_UTC_TZ)
 
 
 def python_to_pendulum_utc_optional(
@@ -36,7 +60,7 @@ def datetime_to_iso_str_optional(
 
 
 def datetime_to_display_local_date_str(datetime: pendulum.DateTime) -> str:
-    return datetime.in_tz("local").format("YYYY-MM-DD ddd")
+    return datetime.in_tz(_LOCAL_TZ).format("YYYY-MM-DD ddd")
 
 
 def datetime_to_display_local_date_str_optional(
@@ -48,7 +72,7 @@ def datetime_to_display_local_date_str_optional(
 
 
 def datetime_to_display_local_datetime_str(datetime: pendulum.DateTime) -> str:
-    return datetime.in_tz("local").format("MMM-DD ddd HH:mm")
+    return datetime.in_tz(_LOCAL_TZ).format("MMM-DD ddd HH:mm")
 
 
 def datetime_to_display_local_datetime_str_optional(
@@ -71,8 +95,8 @@ def datetime_from_str_optional(datetime: Optional[str]) -> Optional[pendulum.Dat
 
 def datetime_from_str_utc(datetime: str) -> pendulum.DateTime:
     pendulum_date_time = cast(pendulum.DateTime, pendulum.parse(datetime))
-    pendulum_date_time = pendulum_date_time.set(tz="local")
-    pendulum_date_time = pendulum_date_time.in_tz("UTC")
+    pendulum_date_time = pendulum_date_time.set(tz=_LOCAL_TZ)
+    pendulum_date_time = pendulum_date_time.in_tz(_UTC_TZ)
     return pendulum_date_time
 
 
@@ -99,7 +123,7 @@ def duration_from_str_optional(duration: Optional[str]) -> Optional[pendulum.Dur
 
 def datetime_to_local_date_str(datetime: pendulum.DateTime) -> str:
     """Convert a pendulum.DateTime to a local date string in 'YYYY-MM-DD' format."""
-    return datetime.in_tz("local").format("YYYY-MM-DD")
+    return datetime.in_tz(_LOCAL_TZ).format("YYYY-MM-DD")
 
 
 def datetime_to_local_date_str_optional(
@@ -113,7 +137,7 @@ def datetime_to_local_date_str_optional(
 
 def datetime_from_local_date_str(date_str: str) -> pendulum.DateTime:
     """Parse a local date string in 'YYYY-MM-DD' format to a pendulum.DateTime at midnight local time."""
-    return cast(pendulum.DateTime, pendulum.parse(date_str, tz="local"))
+    return cast(pendulum.DateTime, pendulum.parse(date_str, tz=_LOCAL_TZ))
 
 
 def datetime_from_local_date_str_optional(
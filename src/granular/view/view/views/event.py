@@ -4,7 +4,7 @@ from typing import cast
 
 import pendulum
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
 from granular.model.entity_id import EntityId
@@ -85,6 +85,19 @@ def events_view(
 def single_event_view(active_context: str, event: Event) -> None:
     header(active_context, "event")
 
+    console = Console()
+    console.print(__event_table(event))
+
+
+def multi_event_view(active_context: str, events: list[Event]) -> None:
+    """Render several events under one header with a single console write."""
+    header(active_context, "event" if len(events) == 1 else "events")
+
+    console = Console()
+    console.print(Group(*[__event_table(event) for event in events]))
+
+
+def __event_table(event: Event) -> Table:
     event_table = Table(box=box.SIMPLE)
     event_table.add_column("property")
     event_table.add_column("value")
@@ -117,5 +130,4 @@ def single_event_view(active_context: str, event: Event) -> None:
         datetime_to_display_local_datetime_str_optional(event["deleted"]),
     )
 
-    console = Console()
-    console.print(event_table)
+    return event_table
@@ -4,7 +4,7 @@ from typing import cast
 
 import pendulum
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
@@ -90,6 +90,23 @@ def logs_view(
 def single_log_report(active_context: str, log: Log) -> None:
     header(active_context, "log")
 
+    console = Console()
+    console.print(Group(*__log_renderables(log)))
+
+
+def multi_log_report(active_context: str, logs: list[Log]) -> None:
+    """Render several logs under one header with a single console write."""
+    header(active_context, "log" if len(logs) == 1 else "logs")
+
+    renderables: list[RenderableType] = []
+    for log in logs:
+        renderables.extend(__log_renderables(log))
+
+    console = Console()
+    console.print(Group(*renderables))
+
+
+def __log_renderables(log: Log) -> list[RenderableType]:
     log_table = Table(box=box.SIMPLE)
     log_table.add_column("property")
     log_table.add_column("value")
@@ -123,10 +140,11 @@ def single_log_report(active_context: str, log: Log) -> None:
         datetime_to_display_local_datetime_str_optional(log["deleted"]) or "",
     )
 
-    console = Console()
-    console.print(log_table)
+    renderables: list[RenderableType] = [log_table]
 
     # Display the log text in a panel
     if log["text"] is not None and log["text"] != "":
-        console.print("\n")
-        console.print(Panel(log["text"], title="Log Text", border_style="blue"))
+        renderables.append("\n")
+        renderables.append(Panel(log["text"], title="Log Text", border_style="blue"))
+
+    return renderables
@@ -4,7 +4,7 @@ from typing import cast
 
 import pendulum
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
@@ -93,6 +93,23 @@ def notes_report(
 def single_note_report(active_context: str, note: Note) -> None:
     header(active_context, "note")
 
+    console = Console()
+    console.print(Group(*__note_renderables(note)))
+
+
+def multi_note_report(active_context: str, notes: list[Note]) -> None:
+    """Render several notes under one header with a single console write."""
+    header(active_context, "note" if len(notes) == 1 else "notes")
+
+    renderables: list[RenderableType] = []
+    for note in notes:
+        renderables.extend(__note_renderables(note))
+
+    console = Console()
+    console.print(Group(*renderables))
+
+
+def __note_renderables(note: Note) -> list[RenderableType]:
     note_table = Table(box=box.SIMPLE)
     note_table.add_column("property")
     note_table.add_column("value")
@@ -129,12 +146,15 @@ def single_note_report(active_context: str, note: Note) -> None:
         datetime_to_display_local_datetime_str_optional(note["deleted"]) or "",
     )
 
-    console = Console()
-    console.print(note_table)
+    renderables: list[RenderableType] = [note_table]
 
     # Display the note text in a panel
     if note["text"] is not None and note["text"] != "":
-        console.print("\n")
+        renderables.append("\n")
         # Use the note's color for the panel border if available
         border_style = note["color"] if note["color"] is not None else "blue"
-        console.print(Panel(note["text"], title="Note Text", border_style=border_style))
+        renderables.append(
+            Panel(note["text"], title="Note Text", border_style=border_style)
+        )
+
+    return renderables
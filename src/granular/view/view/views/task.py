@@ -4,7 +4,7 @@ from typing import cast
 
 import pendulum
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
 from granular.color import COMPLETED_TASK_COLOR
@@ -113,6 +113,23 @@ def single_task_view(
 ) -> None:
     header(active_context, "task")
 
+    console = Console()
+    console.print(__task_table(task, time_audits))
+
+
+def multi_task_view(
+    active_context: str,
+    tasks: list[Task],
+    time_audits: list[TimeAudit] = [],
+) -> None:
+    """Render several tasks under one header with a single console write."""
+    header(active_context, "task" if len(tasks) == 1 else "tasks")
+
+    console = Console()
+    console.print(Group(*(__task_table(task, time_audits) for task in tasks)))
+
+
+def __task_table(task: Task, time_audits: list[TimeAudit]) -> Table:
     task_table = Table(box=box.SIMPLE)
     task_table.add_column("property")
     task_table.add_column("value")
@@ -162,5 +179,4 @@ def single_task_view(
         "updated", datetime_to_display_local_date_str_optional(task["updated"])
     )
 
-    console = Console()
-    console.print(task_table)
+    return task_table